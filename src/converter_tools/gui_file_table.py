@@ -0,0 +1,151 @@
+# converter_tools/gui_file_table.py
+
+try:
+    from PySide6.QtCore import Qt, Signal, QAbstractTableModel, QModelIndex
+except ImportError as e:
+    print(f"FATAL ERROR (gui_file_table.py): PySide6.QtCore not found. {e}")
+    raise
+
+# Constants for table columns
+COL_CHECK = 0
+COL_PATH = 1
+COL_TYPE = 2
+TABLE_HEADINGS = ['✓', 'File Path', 'Type']
+# Above this many separate checked runs, removal rebuilds the list in one pass and resets the view.
+MAX_INCREMENTAL_REMOVE_RUNS = 32
+
+
+class FileRow:
+    """One entry of the input file list; ext is lowercase without the dot."""
+    __slots__ = ("checked", "path", "ext")
+
+    def __init__(self, checked, path, ext):
+        self.checked = checked
+        self.path = path
+        self.ext = ext
+
+
+class FileTableModel(QAbstractTableModel):
+    """
+    Table model over the window's list of FileRow entries.
+    The list is shared with ConverterWindow, which edits it in place and then calls refresh()
+    or notify_check_states_changed(). Row enablement is computed on demand from the visible
+    extension set, so changing the input filter never touches individual cells.
+    """
+    check_state_changed = Signal()
+
+    def __init__(self, rows, parent=None):
+        super().__init__(parent)
+        self._rows = rows
+        self._visible_exts = None  # None enables every row
+
+    def refresh(self):
+        self.beginResetModel()
+        self.endResetModel()
+
+    def remove_checked_rows(self):
+        """
+        Removes every checked row with one beginRemoveRows/endRemoveRows per contiguous run,
+        so the view drops only those rows instead of being reset. Returns the removed rows.
+        Heavily scattered selections are instead filtered in a single pass, since deleting each
+        run separately would shift the list tail once per run.
+        """
+        run_count = sum(
+            1 for i, row_data in enumerate(self._rows)
+            if row_data.checked and (i == 0 or not self._rows[i - 1].checked))
+        if run_count > MAX_INCREMENTAL_REMOVE_RUNS:
+            removed_rows = [row_data for row_data in self._rows if row_data.checked]
+            self.beginResetModel()
+            # Slice assignment keeps the list shared with the window.
+            self._rows[:] = [row_data for row_data in self._rows if not row_data.checked]
+            self.endResetModel()
+            return removed_rows
+
+        removed_rows = []
+        row = len(self._rows) - 1
+        while row >= 0:
+            if not self._rows[row].checked:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and self._rows[row].checked:
+                row -= 1
+            first = row + 1
+            self.beginRemoveRows(QModelIndex(), first, last)
+            removed_rows.extend(self._rows[first:last + 1])
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+        return removed_rows
+
+    def set_visible_exts(self, visible_exts):
+        """Sets the extensions whose rows are enabled; None enables all rows."""
+        self._visible_exts = visible_exts
+        self._emit_rows_changed(0, COL_TYPE)
+
+    def notify_check_states_changed(self):
+        self._emit_rows_changed(COL_CHECK, COL_CHECK)
+
+    def is_row_enabled(self, row):
+        return self._visible_exts is None or self._rows[row].ext in self._visible_exts
+
+    def _emit_rows_changed(self, first_column, last_column):
+        if self._rows:
+            self.dataChanged.emit(self.index(0, first_column),
+                                  self.index(len(self._rows) - 1, last_column))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(TABLE_HEADINGS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return TABLE_HEADINGS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == COL_PATH:
+                return row.path
+            if column == COL_TYPE:
+                # Rows keep the extension lowercase for filtering; only the cell shows it uppercased.
+                return row.ext.upper()
+        elif role == Qt.ItemDataRole.CheckStateRole and column == COL_CHECK:
+            return Qt.CheckState.Checked if row.checked else Qt.CheckState.Unchecked
+        elif role == Qt.ItemDataRole.TextAlignmentRole and column == COL_TYPE:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if index.column() == COL_CHECK:
+            item_flags = Qt.ItemFlag.ItemIsUserCheckable
+        else:
+            item_flags = Qt.ItemFlag.ItemIsSelectable
+        if self.is_row_enabled(index.row()):
+            item_flags |= Qt.ItemFlag.ItemIsEnabled
+        return item_flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or index.column() != COL_CHECK or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        self._rows[index.row()].checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        self.check_state_changed.emit()
+        return True
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        sort_keys = {
+            COL_CHECK: lambda row: row.checked,
+            COL_PATH: lambda row: row.path,
+            COL_TYPE: lambda row: (row.ext, row.path),
+        }
+        self.layoutAboutToBeChanged.emit()
+        self._rows.sort(key=sort_keys[column], reverse=order == Qt.SortOrder.DescendingOrder)
+        self.layoutChanged.emit()
@@ -7,17 +7,25 @@ import time
 import json
 import multiprocessing
 import threading
+import collections
+import logging
 
 try:
     from PySide6.QtWidgets import (
         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-        QPushButton, QCheckBox, QTableWidget, QTableWidgetItem, QHeaderView,
-        QComboBox, QLabel, QTextEdit, QSizePolicy, QSpacerItem, QMenuBar,
+        QPushButton, QCheckBox, QTableView, QHeaderView,
+        QComboBox, QLabel, QTextEdit, QPlainTextEdit, QSizePolicy, QSpacerItem, QMenuBar,
         QFileDialog, QMessageBox, QStatusBar, QDialog, QDialogButtonBox,
         QLineEdit, QSpinBox, QGroupBox, QMenu, QProgressBar
     )
-    from PySide6.QtGui import QAction, QKeySequence, QColor, QPalette, QCloseEvent, QIcon
-    from PySide6.QtCore import Qt, Slot, Signal, QPoint
+    from PySide6.QtGui import (
+        QAction, QKeySequence, QColor, QPalette, QCloseEvent, QIcon, QFont,
+        QTextCharFormat, QTextCursor
+    )
+    from PySide6.QtCore import (
+        Qt, Slot, Signal, QPoint, QTimer, QObject, QThreadPool, QModelIndex,
+        QThread, QMetaObject, Q_ARG, QSignalBlocker
+    )
     from PySide6.QtUiTools import QUiLoader
 except ImportError as e:
     try:
@@ -39,15 +47,47 @@ from . import conversions
 from . import menu_definitions
 
 # GUI components from other files in this package
+from .gui_file_table import (
+    FileRow, FileTableModel, COL_CHECK, COL_PATH, COL_TYPE, TABLE_HEADINGS
+)
 from .gui_settings import SettingsDialog
-from .gui_worker import ConversionWorker, N_STAGES_PER_FILE
-
-# Constants for table columns
-COL_CHECK = 0
-COL_PATH = 1
-COL_TYPE = 2
-TABLE_HEADINGS = ['✓', 'File Path', 'Type']
-
+from .gui_worker import ConversionWorker, FolderScanRunnable, N_STAGES_PER_FILE
+
+# Shutdown/startup tracing; the arguments are only formatted when DEBUG is enabled (see run_gui).
+logger = logging.getLogger(__name__)
+
+# Worker log lines are collected and appended to the log widget at most once per interval.
+LOG_FLUSH_INTERVAL_MS = 50
+# Upper bound on buffered log lines and on paragraphs kept in the log widget.
+LOG_MAX_LINES = 5000
+# Console color names (as used by utils._emit_or_print) that need a more readable shade in the log widget.
+LOG_TEXT_COLORS = {"yellow": "orange"}
+# Worker stage updates are coalesced and only the latest one is shown, at most once per interval (~10 Hz).
+STATUS_UPDATE_INTERVAL_MS = 100
+# Quiet period after the last input filter toggle before the label and table are refreshed.
+FILTER_APPLY_DELAY_MS = 120
+# File progress bar value for each worker stage keyword, checked in order; the first match wins.
+FILE_STAGE_PROGRESS = (
+    ("Preparing", 33),
+    ("Copying", 33),
+    ("Converting", 66),
+    ("Finalizing", 100),
+    ("File failed", 100),
+    ("Interrupted", 100),
+)
+# Workers report the bare stage names, so most updates resolve with one lookup here.
+FILE_STAGE_PROGRESS_EXACT = dict(FILE_STAGE_PROGRESS)
+
+
+def _set_label_text(label, text):
+    """Sets a label's text only when it changes, so repeated progress updates do not re-layout it."""
+    if label.text() != text:
+        label.setText(text)
+
+
+def _set_bar_value(bar, value):
+    if bar.value() != value:
+        bar.setValue(value)
 
 class ConverterWindow(QMainWindow):
     def __init__(self):
@@ -88,50 +128,49 @@ class ConverterWindow(QMainWindow):
         self.ui.setAttribute(Qt.WA_DeleteOnClose, True)
 
         # --- Find UI Elements ---
-        self.job_type_combo = self.ui.findChild(QComboBox, "job_type_combo")
-        self.media_type_combo = self.ui.findChild(QComboBox, "media_type_combo")
-        self.add_files_button = self.ui.findChild(QPushButton, "add_files_button")
-        self.add_folder_button = self.ui.findChild(QPushButton, "add_folder_button")
-        self.recursive_checkbox = self.ui.findChild(QCheckBox, "recursive_checkbox")
-        self.input_file_types_label = self.ui.findChild(QLabel, "input_file_types_label")
-        self.select_input_types_button = self.ui.findChild(QPushButton, "select_input_types_button")
-        self.file_table = self.ui.findChild(QTableWidget, "file_table")
-
-        self.output_folder_group_box = self.ui.findChild(QGroupBox, "output_folder_group_box")
-        self.select_output_folder_button = self.ui.findChild(QPushButton, "select_output_folder_button")
-        self.output_folder_path_display = self.ui.findChild(QLineEdit, "output_folder_path_display")
-        self.output_file_types_label = self.ui.findChild(QLabel, "output_file_types_label")
-        self.select_output_type_button = self.ui.findChild(QPushButton, "select_output_type_button")
-
-        self.overwrite_files_checkbox = self.ui.findChild(QCheckBox, "overwrite_files_checkbox")
-        self.delete_input_checkbox = self.ui.findChild(QCheckBox, "delete_input_checkbox") 
-        self.output_same_folder_checkbox = self.ui.findChild(QCheckBox, "output_same_folder_checkbox")
-
-        self.main_action_button = self.ui.findChild(QPushButton, "main_action_button")
-        self.toggle_log_button = self.ui.findChild(QPushButton, "toggle_log_button")
-        self.clear_log_button = self.ui.findChild(QPushButton, "clear_log_button")
-        self.log_output_text = self.ui.findChild(QTextEdit, "log_output_text")
+        # One walk of the loaded tree builds a name -> object map; every lookup below is then a dict hit.
+        widget_mappings = [
+            ("job_type_combo", QComboBox),
+            ("media_type_combo", QComboBox),
+            ("add_files_button", QPushButton),
+            ("add_folder_button", QPushButton),
+            ("recursive_checkbox", QCheckBox),
+            ("input_file_types_label", QLabel),
+            ("select_input_types_button", QPushButton),
+            ("file_table", QTableView),
+            ("output_folder_group_box", QGroupBox),
+            ("select_output_folder_button", QPushButton),
+            ("output_folder_path_display", QLineEdit),
+            ("output_file_types_label", QLabel),
+            ("select_output_type_button", QPushButton),
+            ("overwrite_files_checkbox", QCheckBox),
+            ("delete_input_checkbox", QCheckBox),
+            ("output_same_folder_checkbox", QCheckBox),
+            ("main_action_button", QPushButton),
+            ("toggle_log_button", QPushButton),
+            ("clear_log_button", QPushButton),
+            ("log_output_text", QPlainTextEdit),
+            ("actionSettings", QAction),
+            ("actionExit", QAction),
+            ("progress_group_box", QGroupBox),
+            ("overall_label", QLabel),
+            ("overall_progress_bar", QProgressBar),
+            ("overall_cancel_button", QPushButton),
+            ("file_label", QLabel),
+            ("file_progress_bar", QProgressBar),
+            ("file_cancel_button", QPushButton),
+        ]
+        ui_objects_by_name = {}
+        for ui_object in self.ui.findChildren(QObject):
+            ui_objects_by_name.setdefault(ui_object.objectName(), ui_object)
+        for attr_name, widget_type in widget_mappings:
+            ui_object = ui_objects_by_name.get(attr_name)
+            setattr(self, attr_name, ui_object if isinstance(ui_object, widget_type) else None)
 
         self.statusbar = self.ui.statusBar() if hasattr(self.ui, 'statusBar') and self.ui.statusBar() else QStatusBar(self.ui)
         if not (hasattr(self.ui, 'statusBar') and self.ui.statusBar()): 
              if isinstance(self.ui.layout(), QVBoxLayout): self.ui.layout().addWidget(self.statusbar)
 
-        self.actionSettings = self.ui.findChild(QAction, "actionSettings")
-        self.actionExit = self.ui.findChild(QAction, "actionExit")
-
-        self.progress_group_box = self.ui.findChild(
-            QGroupBox, "progress_group_box")
-        self.overall_label = self.ui.findChild(QLabel, "overall_label")
-        self.overall_progress_bar = self.ui.findChild(
-            QProgressBar, "overall_progress_bar")
-        self.overall_cancel_button = self.ui.findChild(
-            QPushButton, "overall_cancel_button")
-        self.file_label = self.ui.findChild(QLabel, "file_label")
-        self.file_progress_bar = self.ui.findChild(
-            QProgressBar, "file_progress_bar")
-        self.file_cancel_button = self.ui.findChild(
-            QPushButton, "file_cancel_button")
-
         critical_main_widget_names = [
             "job_type_combo", "media_type_combo", "add_files_button", "file_table",
             "output_folder_group_box", "main_action_button", "log_output_text",
@@ -151,20 +190,41 @@ class ConverterWindow(QMainWindow):
                     sys.exit(-1)
                 return
 
+        # Widgets toggled together when a conversion starts or ends, resolved once without missing entries.
+        self._conversion_toggled_widgets = [widget for widget in (
+            self.add_files_button, self.add_folder_button, self.recursive_checkbox, self.file_table,
+            self.job_type_combo, self.output_same_folder_checkbox, self.delete_input_checkbox,
+            self.overwrite_files_checkbox, self.actionSettings
+        ) if widget]
+        # Re-enabled by the job/media selection refresh rather than directly.
+        self._conversion_locked_widgets = [widget for widget in (
+            self.media_type_combo, self.select_input_types_button, self.select_output_type_button,
+            self.output_folder_group_box
+        ) if widget]
+        self._conversion_cancel_buttons = [widget for widget in (
+            self.overall_cancel_button, self.file_cancel_button
+        ) if widget]
+
         # --- Initialize UI States ---
-        if self.progress_group_box:
-            self.progress_group_box.setVisible(False)
+        self._set_progress_visible(False)
         if self.overall_progress_bar:
             self.overall_progress_bar.setValue(0)
         if self.file_progress_bar:
             self.file_progress_bar.setValue(0)
         if self.overall_label:
             self.overall_label.setText("Overall Progress:")
-        if self.file_label:
-            self.file_label.setText("Current File:")
+        # Mirrors file_label's text so per-stage checks compare Python strings instead of querying the label.
+        self._file_label_text = ""
+        self._set_file_label("Current File:")
+        if self.log_output_text:
+            self.log_output_text.setMaximumBlockCount(LOG_MAX_LINES)
 
+        self.table_data = []
+        self.file_table_model = FileTableModel(self.table_data, self)
         if self.file_table:
-            self.file_table.setHorizontalHeaderLabels(TABLE_HEADINGS)
+            self.file_table.setModel(self.file_table_model)
+            self.file_table.horizontalHeader().setSortIndicator(
+                COL_PATH, Qt.SortOrder.AscendingOrder)
             header = self.file_table.horizontalHeader()
             header.setSectionResizeMode(
                 COL_CHECK, QHeaderView.ResizeMode.ResizeToContents)
@@ -178,7 +238,10 @@ class ConverterWindow(QMainWindow):
                 Qt.ContextMenuPolicy.CustomContextMenu)
             self.file_table.customContextMenuRequested.connect(
                 self._show_file_table_context_menu)
-            self.file_table.cellClicked.connect(self.handle_cell_click)
+            self.file_table.pressed.connect(self._on_file_table_pressed)
+            self.file_table.clicked.connect(self.handle_cell_click)
+        self.file_table_model.check_state_changed.connect(
+            self._schedule_state_update)
 
         # --- Connect Signals and Slots ---
         if self.job_type_combo:
@@ -229,24 +292,63 @@ class ConverterWindow(QMainWindow):
 
         # --- Initialize Member Variables ---
         self.conversion_thread = None
-        self.table_data = []
+        # Index of the paths in table_data, kept in step with every add/remove for O(1) duplicate checks.
+        self._table_paths = set()
+        # Signal objects of folder scans still running on the thread pool, kept alive until they report.
+        self._active_folder_scans = set()
         self.selected_job_details = None
         self.selected_media_type_details = None
         self.active_input_filters = set()
+        # Effective input filter: the active filters, else every input type of the selected media.
+        self._current_valid_exts = frozenset()
+        self._current_valid_exts_sorted = ()
+        # Per-media settings read by every button-state update; refreshed on media selection.
+        self._media_output_exts = ()
+        self._media_requires_output_folder = False
         self.selected_output_filter = None
+        # Filter popups are built once per media selection and only re-synced when reopened.
+        self._input_filter_menu = None
+        self._input_filter_actions = {}
+        self._output_filter_menu = None
+        self._output_filter_actions = {}
+
+        self._pending_log_lines = collections.deque(maxlen=LOG_MAX_LINES)
+        self._log_char_formats = {}
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log_output)
+
+        # Bursts of check/filter/add changes recompute the action button state once, on the next event-loop pass.
+        self._state_update_timer = QTimer(self)
+        self._state_update_timer.setSingleShot(True)
+        self._state_update_timer.setInterval(0)
+        self._state_update_timer.timeout.connect(self.update_convert_button_state)
+
+        self._pending_status_update = None
+        self._critical_error_box = None  # Built on the first critical error, then reused
+        self._pressed_check_state = None  # (row, checked) when the check column was last pressed
+        self._settings_dialog = None  # Built on the first open_settings(), then reused
+        self._status_update_timer = QTimer(self)
+        self._status_update_timer.setSingleShot(True)
+        self._status_update_timer.setInterval(STATUS_UPDATE_INTERVAL_MS)
+        self._status_update_timer.timeout.connect(self._apply_pending_status_update)
+
+        # Rapid input filter toggles re-filter the table once, after the user pauses.
+        self._filter_apply_timer = QTimer(self)
+        self._filter_apply_timer.setSingleShot(True)
+        self._filter_apply_timer.setInterval(FILTER_APPLY_DELAY_MS)
+        self._filter_apply_timer.timeout.connect(self._apply_input_filter_change)
 
         # --- Initial UI Setup ---
         self._populate_job_types()
-        if self.delete_input_checkbox:
-            self.delete_input_checkbox.setChecked(
-                config.settings.DELETE_SOURCE_ON_SUCCESS)
+        self._sync_delete_input_checkbox()
         if self.output_same_folder_checkbox:
             self._on_output_same_folder_toggled(
                 self.output_same_folder_checkbox.isChecked())
 
         self.update_ui_for_job_selection()
-        if self.statusbar:
-            self.statusbar.showMessage("Ready. Select a job type to begin.")
+        self._set_status("Ready. Select a job type to begin.")
         self.ui.setWindowTitle("Converter Tool")
 
     def _ensure_thread_stopped(self):
@@ -262,19 +364,18 @@ class ConverterWindow(QMainWindow):
 
     @Slot()
     def _on_about_to_quit(self):
-        print("DEBUG: QApplication.aboutToQuit signal received in ConverterWindow.")
+        logger.debug("QApplication.aboutToQuit signal received in ConverterWindow.")
         self._ensure_thread_stopped()
         if self.conversion_thread and self.conversion_thread.isRunning():
-            print("DEBUG: Conversion thread is running, requesting stop during app quit.")
+            logger.debug("Conversion thread is running, requesting stop during app quit.")
             self.conversion_thread.request_stop()
             if not self.conversion_thread.wait(2000):
-                print(
-                    "DEBUG: Conversion thread did not stop gracefully after 2s in aboutToQuit.")
+                logger.debug("Conversion thread did not stop gracefully after 2s in aboutToQuit.")
             else:
-                print("DEBUG: Conversion thread stopped gracefully in aboutToQuit.")
+                logger.debug("Conversion thread stopped gracefully in aboutToQuit.")
         else:
-            print("DEBUG: No conversion thread running or thread is None in aboutToQuit.")
-        print("DEBUG: Exiting _on_about_to_quit in ConverterWindow.")
+            logger.debug("No conversion thread running or thread is None in aboutToQuit.")
+        logger.debug("Exiting _on_about_to_quit in ConverterWindow.")
 
     @Slot()
     def _request_conversion_stop(self):
@@ -284,40 +385,34 @@ class ConverterWindow(QMainWindow):
                 self.overall_cancel_button.setEnabled(False)
             if self.file_cancel_button:
                 self.file_cancel_button.setEnabled(False)
-            if self.statusbar:
-                self.statusbar.showMessage("Cancellation requested...")
+            self._set_status("Cancellation requested...")
 
     @Slot()
     def start_conversion(self):
+        # Apply a filter toggle still waiting on its debounce so the table shows the rows that will convert.
+        if self._filter_apply_timer.isActive():
+            self._filter_apply_timer.stop()
+            self._apply_input_filter_change()
         if self.conversion_thread and self.conversion_thread.isRunning():
             QMessageBox.warning(
                 self, "Busy", "A conversion is already in progress.")
             return
+        if self._active_folder_scans:
+            # Scan results arriving mid-run would add rows to the disabled table and refresh START.
+            QMessageBox.warning(
+                self, "Busy", "Folders are still being scanned. Wait for the scan to finish before starting.")
+            return
         if not self.selected_media_type_details:
             QMessageBox.warning(self, "Setup Error",
                                 "Please select a valid job and media type.")
             return
 
-        job_output_ext_config = self.selected_media_type_details.get(
-            "output_ext", [])
-        if job_output_ext_config and not self.selected_output_filter:
+        if self._media_output_exts and not self.selected_output_filter:
             QMessageBox.warning(
                 self, "Setup Error", "Please select an output file type for this job.")
             return
 
-        selected_files_data = []
-        for i, row_data in enumerate(self.table_data):
-            if row_data[COL_CHECK]:
-                item_type_in_table = row_data[COL_TYPE].lower()
-                current_active_input_exts = self.active_input_filters
-                if not current_active_input_exts and self.selected_media_type_details:
-                    current_active_input_exts = set(
-                        self.selected_media_type_details.get("input_ext", []))
-
-                if not self.selected_media_type_details or \
-                   not current_active_input_exts or \
-                   item_type_in_table in current_active_input_exts:
-                    selected_files_data.append(row_data)
+        selected_files_data = list(self._iter_active_checked_rows())
 
         if not selected_files_data:
             QMessageBox.warning(
@@ -325,34 +420,30 @@ class ConverterWindow(QMainWindow):
             return
 
         total_files_to_process = len(selected_files_data)
-        selected_file_paths = [data[COL_PATH] for data in selected_files_data]
+        selected_file_paths = [data.path for data in selected_files_data]
 
         output_folder = None
-        job_requires_output_folder_ui_section = self.selected_media_type_details.get(
-            "requires_output_folder", False)
-
-        if job_requires_output_folder_ui_section and self.output_same_folder_checkbox and not self.output_same_folder_checkbox.isChecked():
+        if self._media_requires_output_folder and self.output_same_folder_checkbox and not self.output_same_folder_checkbox.isChecked():
             if self.output_folder_path_display:
                 output_folder = self.output_folder_path_display.text().strip()
             if not output_folder:
                 QMessageBox.warning(self, "Output Folder Missing",
                                     "Please select an output folder or choose 'Output in same folder'.")
                 return
+            # An existing folder costs one stat; otherwise makedirs itself reports a non-directory in the way.
             if not os.path.isdir(output_folder):
-                if not os.path.exists(output_folder):
-                    try:
-                        os.makedirs(output_folder)
-                        if self.log_output_text:
-                            self.log_output_text.append(
-                                f"INFO: Created output directory: {output_folder}")
-                    except Exception as e:
-                        QMessageBox.critical(
-                            self, "Output Folder Error", f"Could not create output folder: {output_folder}\nError: {e}")
-                        return
-                else:
+                try:
+                    os.makedirs(output_folder)
+                    self._emit_or_print(
+                        f"INFO: Created output directory: {output_folder}")
+                except FileExistsError:
                     QMessageBox.critical(
                         self, "Output Folder Error", f"Specified output path is not a directory: {output_folder}")
                     return
+                except Exception as e:
+                    QMessageBox.critical(
+                        self, "Output Folder Error", f"Could not create output folder: {output_folder}\nError: {e}")
+                    return
 
             estimated_min_gb = 0.1
             free_space_gb = utils.get_free_disk_space_gb(output_folder)
@@ -386,11 +477,9 @@ class ConverterWindow(QMainWindow):
         current_overwrite_files = self.overwrite_files_checkbox.isChecked(
         ) if self.overwrite_files_checkbox else False
 
+        # Also shows the progress group and enables the cancel buttons.
         self.set_ui_enabled_for_conversion(False)
 
-        if self.progress_group_box:
-            self.progress_group_box.setVisible(True)
-
         if self.overall_label:
             self.overall_label.setText(
                 f"Overall Progress (0/{total_files_to_process} files)")
@@ -399,26 +488,20 @@ class ConverterWindow(QMainWindow):
                 total_files_to_process * N_STAGES_PER_FILE)
             self.overall_progress_bar.setValue(0)
 
-        if self.file_label:
-            self.file_label.setText("Current File: -")
+        self._set_file_label("Current File: -")
         if self.file_progress_bar:
             self.file_progress_bar.setRange(0, 100)
             self.file_progress_bar.setValue(0)
 
-        if self.overall_cancel_button:
-            self.overall_cancel_button.setEnabled(True)
-        if self.file_cancel_button:
-            self.file_cancel_button.setEnabled(True)
-
         action_button_text = self.main_action_button.text(
         ) if self.main_action_button else "Job"
-        if self.statusbar:
-            self.statusbar.showMessage(
-                f"Starting '{action_button_text}' for {total_files_to_process} file(s)...")
+        self._set_status(
+            f"Starting '{action_button_text}' for {total_files_to_process} file(s)...")
 
         if self.log_output_text and not self.log_output_text.isVisible():
             if self.toggle_log_button:
                 self.toggle_log_button.setChecked(True)
+        self._pending_log_lines.clear()
         if self.log_output_text:
             self.log_output_text.clear()
 
@@ -429,8 +512,6 @@ class ConverterWindow(QMainWindow):
         )
         self.conversion_thread.status_update.connect(
             self.handle_overall_progress_update)
-        self.conversion_thread.file_progress_update.connect(
-            self.handle_file_progress_update)
         self.conversion_thread.output_update.connect(self.handle_output_update)
         self.conversion_thread.error_update.connect(self.handle_error_update)
         self.conversion_thread.critical_error_occurred.connect(
@@ -441,131 +522,147 @@ class ConverterWindow(QMainWindow):
 
     @Slot(str)
     def handle_critical_error(self, message):
-        QMessageBox.critical(self, "Critical Conversion Error", message)
+        self._apply_pending_status_update()
+        if self._critical_error_box is None:
+            self._critical_error_box = QMessageBox(
+                QMessageBox.Icon.Critical, "Critical Conversion Error", "", QMessageBox.StandardButton.Ok, self)
+        if self._critical_error_box.isVisible():
+            # Errors raised while the dialog is open are appended below the first one instead of
+            # replacing it; the call that owns exec() re-enables the UI once the dialog is closed.
+            earlier_errors = self._critical_error_box.informativeText()
+            self._critical_error_box.setInformativeText(
+                f"{earlier_errors}\n{message}" if earlier_errors else message)
+            return
+        self._critical_error_box.setText(message)
+        self._critical_error_box.setInformativeText("")
+        self._critical_error_box.exec()
+        # Re-enabling also hides the progress group and schedules the button-state update.
         self.set_ui_enabled_for_conversion(True)
-        self.update_convert_button_state()
-        if self.progress_group_box:
-            self.progress_group_box.setVisible(False)
 
     @Slot(int, int, str)
     def handle_overall_progress_update(self, current_overall_step, total_overall_steps, phase_description):
+        # Later updates supersede earlier ones, so a burst of stages costs a single repaint.
+        self._pending_status_update = (current_overall_step, total_overall_steps, phase_description)
+        if not self._status_update_timer.isActive():
+            self._status_update_timer.start()
+
+    @Slot()
+    def _apply_pending_status_update(self):
+        self._status_update_timer.stop()
+        if self._pending_status_update is None:
+            return
+        current_overall_step, total_overall_steps, phase_description = self._pending_status_update
+        self._pending_status_update = None
+
         if self.overall_progress_bar:
-            self.overall_progress_bar.setMaximum(total_overall_steps)
-            self.overall_progress_bar.setValue(current_overall_step)
+            if self.overall_progress_bar.maximum() != total_overall_steps:
+                self.overall_progress_bar.setMaximum(total_overall_steps)
+            _set_bar_value(self.overall_progress_bar, current_overall_step)
 
         parts = phase_description.split(': ', 1)
         current_op_label = parts[0]
         current_filename_display = parts[1] if len(parts) > 1 else ""
 
         if self.overall_label:
-            self.overall_label.setText(
-                f"Overall: {phase_description} ({current_overall_step}/{total_overall_steps} stages)")
-        if self.statusbar:
-            self.statusbar.showMessage(f"Overall: {phase_description}")
+            _set_label_text(
+                self.overall_label, f"Overall: {phase_description} ({current_overall_step}/{total_overall_steps} stages)")
+        self._set_status(f"Overall: {phase_description}")
 
+        # The file bar ends up at one value per update, so it is resolved first and set once.
+        file_bar_value = None
+        current_file_label_text = self._file_label_text
         if "Preparing" in current_op_label or "Copying" in current_op_label or \
-           (self.file_label and (self.file_label.text() == "Current File: -" or
-                                 (current_filename_display and current_filename_display not in self.file_label.text()))):
-            if self.file_label:
-                self.file_label.setText(f"Current: {current_filename_display}")
+           (self.file_label and (current_file_label_text == "Current File: -" or
+                                 (current_filename_display and current_filename_display not in current_file_label_text))):
+            self._set_file_label(f"Current: {current_filename_display}")
             if self.file_progress_bar:
                 self.file_progress_bar.setRange(0, 100)
-                self.file_progress_bar.setValue(0)
+            file_bar_value = 0
+
+        try:
+            file_bar_value = FILE_STAGE_PROGRESS_EXACT[current_op_label]
+        except KeyError:
+            for stage_keyword, stage_value in FILE_STAGE_PROGRESS:
+                if stage_keyword in current_op_label:
+                    file_bar_value = stage_value
+                    break
 
-        if self.file_progress_bar:
-            if "Preparing" in current_op_label or "Copying" in current_op_label:
-                self.file_progress_bar.setValue(33)
-            elif "Converting" in current_op_label:
-                self.file_progress_bar.setValue(66)
-            elif "Finalizing" in current_op_label or "File failed" in current_op_label or "Interrupted" in current_op_label:
-                self.file_progress_bar.setValue(100)
-
-    @Slot(int)
-    def handle_file_progress_update(self, percentage):
-        if self.file_progress_bar:
-            if percentage == 100:
-                self.file_progress_bar.setValue(100)
+        if self.file_progress_bar and file_bar_value is not None:
+            _set_bar_value(self.file_progress_bar, file_bar_value)
+
+    def _set_status(self, message, timeout=0):
+        """Shows a status bar message, skipping a persistent one that is already displayed."""
+        if not self.statusbar:
+            return
+        # Timed messages are always re-shown so that repeating one restarts its timeout.
+        if timeout or self.statusbar.currentMessage() != message:
+            self.statusbar.showMessage(message, timeout)
+
+    def _set_file_label(self, text):
+        if self.file_label and text != self._file_label_text:
+            self._file_label_text = text
+            self.file_label.setText(text)
 
     @Slot(int, int)
     def handle_conversion_finished(self, success_count, fail_count):
+        self._apply_pending_status_update()
         total_attempted = success_count + fail_count
         status_msg = f"Job finished. Success: {success_count}, Failed: {fail_count} (Total attempted: {total_attempted})."
-        if self.statusbar:
-            self.statusbar.showMessage(status_msg)
-        if self.log_output_text:
-            self.log_output_text.append(f"\n<b>{status_msg}</b>")
+        self._set_status(status_msg)
+        self._queue_log_line(f"\n{status_msg}", bold=True)
+        self._flush_log_output()
 
         if self.overall_progress_bar:
-            self.overall_progress_bar.setValue(
-                self.overall_progress_bar.maximum())
+            _set_bar_value(self.overall_progress_bar, self.overall_progress_bar.maximum())
 
-        if self.file_label:
-            self.file_label.setText("Finished.")
+        self._set_file_label("Finished.")
         if self.file_progress_bar:
-            self.file_progress_bar.setValue(100 if total_attempted > 0 else 0)
-
-        if self.overall_cancel_button:
-            self.overall_cancel_button.setEnabled(False)
-        if self.file_cancel_button:
-            self.file_cancel_button.setEnabled(False)
+            _set_bar_value(self.file_progress_bar, 100 if total_attempted > 0 else 0)
 
+        # Also disables the cancel buttons along with the rest of the batched widget changes.
         self.set_ui_enabled_for_conversion(True)
         self.conversion_thread = None
-        self.update_convert_button_state()
 
     def set_ui_enabled_for_conversion(self, enabled):
-        if self.add_files_button:
-            self.add_files_button.setEnabled(enabled)
-        if self.add_folder_button:
-            self.add_folder_button.setEnabled(enabled)
-        if self.recursive_checkbox:
-            self.recursive_checkbox.setEnabled(enabled)
-        if self.file_table:
-            self.file_table.setEnabled(enabled)
-        if self.job_type_combo:
-            self.job_type_combo.setEnabled(enabled)
-        if self.output_same_folder_checkbox:
-            self.output_same_folder_checkbox.setEnabled(enabled)
-        if self.delete_input_checkbox:
-            self.delete_input_checkbox.setEnabled(enabled)
-        if self.overwrite_files_checkbox:
-            self.overwrite_files_checkbox.setEnabled(enabled)
-        if self.actionSettings:
-            self.actionSettings.setEnabled(enabled)
+        # Many widgets change state together; suspending updates turns that into one repaint at the end.
+        self.ui.setUpdatesEnabled(False)
+        try:
+            self._apply_conversion_ui_state(enabled)
+        finally:
+            self.ui.setUpdatesEnabled(True)
+
+    def _set_progress_visible(self, visible):
+        if self.progress_group_box and self.progress_group_box.isHidden() == visible:
+            self.progress_group_box.setVisible(visible)
+
+    def _apply_conversion_ui_state(self, enabled):
+        for widget in self._conversion_toggled_widgets:
+            widget.setEnabled(enabled)
 
         if enabled:
             self.update_ui_for_job_selection()
-            if self.progress_group_box:
-                self.progress_group_box.setVisible(False)
-            self.update_convert_button_state()
+            self._set_progress_visible(False)
+            self._schedule_state_update()
         else:
-            if self.media_type_combo:
-                self.media_type_combo.setEnabled(False)
-            if self.select_input_types_button:
-                self.select_input_types_button.setEnabled(False)
-            if self.select_output_type_button:
-                self.select_output_type_button.setEnabled(False)
-            if self.output_folder_group_box:
-                self.output_folder_group_box.setEnabled(False)
+            for widget in self._conversion_locked_widgets:
+                widget.setEnabled(False)
             if self.main_action_button:
+                self._state_update_timer.stop()
                 self.main_action_button.setEnabled(False)
 
-            if self.progress_group_box:
-                self.progress_group_box.setVisible(True)
-            if self.overall_cancel_button:
-                self.overall_cancel_button.setEnabled(True)
-            if self.file_cancel_button:
-                self.file_cancel_button.setEnabled(True)
+            self._set_progress_visible(True)
+        # The cancel buttons are only live while a conversion runs.
+        for widget in self._conversion_cancel_buttons:
+            widget.setEnabled(not enabled)
 
     def _populate_job_types(self):
         if not self.job_type_combo:
             return
-        self.job_type_combo.blockSignals(True)
-        self.job_type_combo.clear()
-        self.job_type_combo.addItem("(Select Job Type)")
-        for job in menu_definitions.JOB_DEFINITIONS:
-            self.job_type_combo.addItem(job["job_name"])
-        self.job_type_combo.blockSignals(False)
+        with QSignalBlocker(self.job_type_combo):
+            self.job_type_combo.clear()
+            self.job_type_combo.addItem("(Select Job Type)")
+            for job in menu_definitions.JOB_DEFINITIONS:
+                self.job_type_combo.addItem(job["job_name"])
         self.job_type_combo.setCurrentIndex(0)
 
     @Slot(bool)
@@ -580,42 +677,45 @@ class ConverterWindow(QMainWindow):
 
         if checked and self.output_folder_path_display:
             self.output_folder_path_display.clear()
-        self.update_convert_button_state()
+        self._schedule_state_update()
+
+    def _sync_delete_input_checkbox(self):
+        # Mirrors the saved setting without running the toggle handler, which would write it back
+        # and replace the current status message.
+        if self.delete_input_checkbox:
+            with QSignalBlocker(self.delete_input_checkbox):
+                self.delete_input_checkbox.setChecked(
+                    config.settings.DELETE_SOURCE_ON_SUCCESS)
 
     @Slot(bool)
     def _on_delete_input_toggled(self, checked):
         config.settings.DELETE_SOURCE_ON_SUCCESS = checked
-        if self.statusbar:
-            self.statusbar.showMessage(
-                f"Delete input files on success: {'Enabled' if checked else 'Disabled'}")
+        self._set_status(
+            f"Delete input files on success: {'Enabled' if checked else 'Disabled'}")
 
     @Slot(str)
     def _on_job_type_changed(self, selected_job_name):
         if not self.media_type_combo:
             return
-        self.media_type_combo.blockSignals(True)
-        self.media_type_combo.clear()
-        self.media_type_combo.addItem("(Select Media Type)")
+        with QSignalBlocker(self.media_type_combo):
+            self.media_type_combo.clear()
+            self.media_type_combo.addItem("(Select Media Type)")
 
-        self.selected_job_details = None
-        self.selected_media_type_details = None
-        self.active_input_filters.clear()
-        self.selected_output_filter = None
+            self.selected_job_details = None
+            self.selected_media_type_details = None
+            self.active_input_filters.clear()
+            self.selected_output_filter = None
 
-        if selected_job_name and selected_job_name != "(Select Job Type)":
-            for job_def in menu_definitions.JOB_DEFINITIONS:
-                if job_def["job_name"] == selected_job_name:
+            if selected_job_name and selected_job_name != "(Select Job Type)":
+                job_def = menu_definitions.JOB_DEFINITIONS_BY_NAME.get(selected_job_name)
+                if job_def:
                     self.selected_job_details = job_def
                     for media_type in job_def.get("media_types", []):
                         self.media_type_combo.addItem(media_type["media_name"])
-                    break
-
-        self.media_type_combo.blockSignals(False)
         self.media_type_combo.setCurrentIndex(0)
         self.update_ui_for_job_selection()
-        if self.statusbar:
-            self.statusbar.showMessage(
-                f"Job type '{selected_job_name}' selected. Now select a media type.")
+        self._set_status(
+            f"Job type '{selected_job_name}' selected. Now select a media type.")
 
     @Slot(str)
     def _on_media_type_changed(self, selected_media_name):
@@ -624,19 +724,19 @@ class ConverterWindow(QMainWindow):
         self.selected_output_filter = None
 
         if self.selected_job_details and selected_media_name and selected_media_name != "(Select Media Type)":
-            for media_def in self.selected_job_details.get("media_types", []):
-                if media_def["media_name"] == selected_media_name:
-                    self.selected_media_type_details = media_def
-                    self.active_input_filters = set(
-                        self.selected_media_type_details.get("input_ext", []))
-                    output_exts = self.selected_media_type_details.get(
-                        "output_ext", [])
-                    if output_exts:
-                        if isinstance(output_exts, list) and len(output_exts) == 1 and output_exts[0]:
-                            self.selected_output_filter = output_exts[0]
-                        elif isinstance(output_exts, str):
-                            self.selected_output_filter = output_exts
-                    break
+            media_def = self.selected_job_details["_media_by_name"].get(
+                selected_media_name)
+            if media_def:
+                self.selected_media_type_details = media_def
+                self.active_input_filters = set(
+                    self.selected_media_type_details["_input_ext_set"])
+                output_exts = self.selected_media_type_details.get(
+                    "output_ext", [])
+                if output_exts:
+                    if isinstance(output_exts, list) and len(output_exts) == 1 and output_exts[0]:
+                        self.selected_output_filter = output_exts[0]
+                    elif isinstance(output_exts, str):
+                        self.selected_output_filter = output_exts
 
         self.update_ui_for_media_selection()
 
@@ -652,7 +752,34 @@ class ConverterWindow(QMainWindow):
 
         self.update_ui_for_media_selection()
 
+    def _refresh_media_attrs(self):
+        media = self.selected_media_type_details
+        if not media:
+            self._media_output_exts = ()
+            self._media_requires_output_folder = False
+            return
+        output_exts = media.get("output_ext", [])
+        if isinstance(output_exts, str):
+            output_exts = [output_exts] if output_exts else []
+        self._media_output_exts = tuple(output_exts)
+        self._media_requires_output_folder = bool(media.get("requires_output_folder", False))
+
+    def _refresh_current_valid_exts(self):
+        if self.active_input_filters:
+            self._current_valid_exts = frozenset(self.active_input_filters)
+        elif self.selected_media_type_details:
+            self._current_valid_exts = self.selected_media_type_details["_input_ext_set"]
+        else:
+            self._current_valid_exts = frozenset()
+        # Kept presorted for the filter labels and status messages.
+        self._current_valid_exts_sorted = tuple(sorted(self._current_valid_exts))
+
     def update_ui_for_media_selection(self):
+        # A new media selection re-applies its own filter below; drop any pending toggle refresh.
+        self._filter_apply_timer.stop()
+        self._discard_filter_menus()
+        self._refresh_media_attrs()
+        self._refresh_current_valid_exts()
         media_is_selected = bool(self.selected_media_type_details)
 
         action_text = "START JOB"
@@ -669,12 +796,9 @@ class ConverterWindow(QMainWindow):
             action_text = self.selected_media_type_details.get(
                 "action_text", action_text).upper()
 
-            current_display_input_exts = self.active_input_filters
-            if not current_display_input_exts:
-                current_display_input_exts = set(
-                    self.selected_media_type_details.get("input_ext", []))
-            input_ext_str = ", ".join([f".{ext}" for ext in sorted(
-                list(current_display_input_exts))]) if current_display_input_exts else "Any"
+            current_display_input_exts = self._current_valid_exts
+            input_ext_str = ", ".join([f".{ext}" for ext in self._current_valid_exts_sorted]) \
+                if current_display_input_exts else "Any"
 
             possible_output_exts = self.selected_media_type_details.get(
                 "output_ext", [])
@@ -733,134 +857,141 @@ class ConverterWindow(QMainWindow):
                 self.output_folder_path_display.clear()
 
         self._apply_filter_to_table()
-        self.update_convert_button_state()
 
     @Slot()
     def _on_select_input_types_clicked(self):
         if not self.selected_media_type_details:
-            if self.statusbar:
-                self.statusbar.showMessage(
-                    "Please select a job and media type first.", 3000)
+            self._set_status(
+                "Please select a job and media type first.", 3000)
             return
 
         possible_input_exts = self.selected_media_type_details.get(
             "input_ext", [])
         if not possible_input_exts:
-            if self.statusbar:
-                self.statusbar.showMessage(
-                    "No specific input types to filter for this selection.", 3000)
+            self._set_status(
+                "No specific input types to filter for this selection.", 3000)
             return
 
-        menu = QMenu(self)
-        for ext in sorted(possible_input_exts):
-            action = QAction(f".{ext}", self)
-            action.setCheckable(True)
+        if self._input_filter_menu is None:
+            self._input_filter_menu = QMenu(self)
+            self._input_filter_menu.triggered.connect(self._on_input_filter_action_triggered)
+            # Offer the lowercase set so active_input_filters compares directly with the rows' stored types.
+            for ext in sorted(self.selected_media_type_details["_input_ext_set"]):
+                action = self._input_filter_menu.addAction(f".{ext}")
+                action.setCheckable(True)
+                action.setData(ext)
+                self._input_filter_actions[ext] = action
+        for ext, action in self._input_filter_actions.items():
+            # setChecked() does not emit triggered, so syncing never re-runs the handler.
             action.setChecked(ext in self.active_input_filters)
-            action.toggled.connect(
-                lambda checked, current_ext=ext: self._on_input_filter_type_toggled(checked, current_ext))
-            menu.addAction(action)
+        menu = self._input_filter_menu
 
         if self.select_input_types_button:
             button_pos = self.select_input_types_button.mapToGlobal(
                 QPoint(0, self.select_input_types_button.height()))
             menu.exec(button_pos)
 
+    def _discard_filter_menus(self):
+        for menu in (self._input_filter_menu, self._output_filter_menu):
+            if menu is not None:
+                menu.deleteLater()
+        self._input_filter_menu = None
+        self._input_filter_actions = {}
+        self._output_filter_menu = None
+        self._output_filter_actions = {}
+
+    @Slot(QAction)
+    def _on_input_filter_action_triggered(self, action):
+        self._on_input_filter_type_toggled(action.isChecked(), action.data())
+
     @Slot(bool, str)
     def _on_input_filter_type_toggled(self, checked, extension):
         if checked:
             self.active_input_filters.add(extension)
         else:
             self.active_input_filters.discard(extension)
+        self._refresh_current_valid_exts()
+        self._filter_apply_timer.start()
 
-        active_filter_display_list = sorted(list(self.active_input_filters))
+    @Slot()
+    def _apply_input_filter_change(self):
+        active_filter_display_list = self._current_valid_exts_sorted if self.active_input_filters else ()
         if self.input_file_types_label:
             if active_filter_display_list:
-                self.input_file_types_label.setText(
-                    f"Input: {', '.join(['.' + ext for ext in active_filter_display_list])}")
+                label_text = f"Input: {', '.join(['.' + ext for ext in active_filter_display_list])}"
             elif self.selected_media_type_details:
                 all_media_exts = self.selected_media_type_details.get(
                     "input_ext", [])
-                self.input_file_types_label.setText(
-                    f"Input: {', '.join(['.' + ext for ext in all_media_exts]) if all_media_exts else 'Any'}")
+                label_text = f"Input: {', '.join(['.' + ext for ext in all_media_exts]) if all_media_exts else 'Any'}"
             else:
-                self.input_file_types_label.setText("Input: N/A")
+                label_text = "Input: N/A"
+            # Toggling a type off and back on within the debounce window leaves the text unchanged.
+            _set_label_text(self.input_file_types_label, label_text)
 
-        if self.statusbar:
-            self.statusbar.showMessage(
-                f"Input filter updated. Active: {', '.join(active_filter_display_list) if active_filter_display_list else 'None (showing all for media type)'}", 3000)
+        self._set_status(
+            f"Input filter updated. Active: {', '.join(active_filter_display_list) if active_filter_display_list else 'None (showing all for media type)'}", 3000)
         self._apply_filter_to_table()
-        self.update_convert_button_state()
 
     @Slot()
     def _on_select_output_type_clicked(self):
         if not self.selected_media_type_details:
-            if self.statusbar:
-                self.statusbar.showMessage(
-                    "Please select a media type first.", 3000)
+            self._set_status(
+                "Please select a media type first.", 3000)
             return
 
         possible_output_exts = self.selected_media_type_details.get(
             "output_ext", [])
         if not isinstance(possible_output_exts, list) or not possible_output_exts:
-            if self.statusbar:
-                self.statusbar.showMessage(
-                    "No selectable output types for this media.", 3000)
+            self._set_status(
+                "No selectable output types for this media.", 3000)
             return
 
-        menu = QMenu(self)
-        for ext_string in possible_output_exts:
-            if not ext_string:
-                continue
-            action = QAction(f".{ext_string}", self)
-            action.setCheckable(True)
+        if self._output_filter_menu is None:
+            self._output_filter_menu = QMenu(self)
+            self._output_filter_menu.triggered.connect(self._on_output_filter_action_triggered)
+            for ext_string in possible_output_exts:
+                if not ext_string:
+                    continue
+                action = self._output_filter_menu.addAction(f".{ext_string}")
+                action.setCheckable(True)
+                action.setData(ext_string)
+                self._output_filter_actions[ext_string] = action
+        for ext_string, action in self._output_filter_actions.items():
             action.setChecked(ext_string == self.selected_output_filter)
-            action.triggered.connect(
-                lambda checked_status=False, bound_ext_string=ext_string: self._on_output_filter_type_selected(bound_ext_string))
-            menu.addAction(action)
+        menu = self._output_filter_menu
 
         if self.select_output_type_button:
             button_pos = self.select_output_type_button.mapToGlobal(
                 QPoint(0, self.select_output_type_button.height()))
             menu.exec(button_pos)
 
+    @Slot(QAction)
+    def _on_output_filter_action_triggered(self, action):
+        self._on_output_filter_type_selected(action.data())
+
     @Slot(str)
     def _on_output_filter_type_selected(self, extension):
         self.selected_output_filter = extension
         if self.output_file_types_label:
-            self.output_file_types_label.setText(f"Output: .{extension}")
-        if self.statusbar:
-            self.statusbar.showMessage(
-                f"Output type set to: .{extension}", 3000)
-        self.update_convert_button_state()
+            _set_label_text(self.output_file_types_label, f"Output: .{extension}")
+        self._set_status(
+            f"Output type set to: .{extension}", 3000)
+        self._schedule_state_update()
 
     def _apply_filter_to_table(self):
         if not self.file_table:
             return
 
-        visible_exts_for_current_selection = self.active_input_filters
-        if not visible_exts_for_current_selection and self.selected_media_type_details:
-            visible_exts_for_current_selection = set(
-                self.selected_media_type_details.get("input_ext", []))
-
-        for i in range(self.file_table.rowCount()):
-            row_data_type_str = self.table_data[i][COL_TYPE].lower()
-
-            is_enabled = False
-            if not self.selected_media_type_details:
-                is_enabled = True
-            elif visible_exts_for_current_selection:
-                if row_data_type_str in visible_exts_for_current_selection:
-                    is_enabled = True
-
-            self.set_row_enabled_state(i, is_enabled)
-
-            if not is_enabled and self.table_data[i][COL_CHECK]:
-                self.table_data[i][COL_CHECK] = False
-                item = self.file_table.item(i, COL_CHECK)
-                if item:
-                    item.setCheckState(Qt.CheckState.Unchecked)
+        if not self.selected_media_type_details:
+            visible_exts = None
+        else:
+            visible_exts = self._current_valid_exts
+            for row in self.table_data:
+                if row.checked and row.ext not in visible_exts:
+                    row.checked = False
+        self.file_table_model.set_visible_exts(visible_exts)
 
-        self.update_convert_button_state()
+        self._schedule_state_update()
 
     @Slot()
     def _on_select_output_folder_clicked(self):
@@ -871,40 +1002,42 @@ class ConverterWindow(QMainWindow):
             self.ui, "Select Output Folder", current_path)
         if folder:
             self.output_folder_path_display.setText(os.path.normpath(folder))
-        self.update_convert_button_state()
+        self._schedule_state_update()
+
+    def _iter_active_checked_rows(self):
+        """Yields the checked rows whose type passes the current input filter."""
+        # Empty whenever no media is selected, so the cached set alone decides whether to filter.
+        active_exts = self._current_valid_exts
+        if active_exts:
+            return (row for row in self.table_data if row.checked and row.ext in active_exts)
+        return (row for row in self.table_data if row.checked)
+
+    def _schedule_state_update(self):
+        if not self._state_update_timer.isActive():
+            self._state_update_timer.start()
 
     @Slot()
     def update_convert_button_state(self):
         if not self.main_action_button:
             return
 
+        # A running conversion or a pending folder scan keeps START disabled regardless of the selection.
+        if (self.conversion_thread and self.conversion_thread.isRunning()) or self._active_folder_scans:
+            self.main_action_button.setEnabled(False)
+            return
+
         job_and_media_selected = bool(self.selected_media_type_details)
 
         output_type_ok = True
-        if self.selected_media_type_details:
-            defined_output_exts = self.selected_media_type_details.get(
-                "output_ext", [])
-            if defined_output_exts:
-                output_type_ok = bool(self.selected_output_filter)
+        if self._media_output_exts:
+            output_type_ok = bool(self.selected_output_filter)
 
         files_checked_and_active = False
         if self.file_table:
-            for i, row_data in enumerate(self.table_data):
-                if row_data[COL_CHECK]:
-                    item_type_in_table = row_data[COL_TYPE].lower()
-                    current_filter_set = self.active_input_filters
-                    if not current_filter_set and self.selected_media_type_details:
-                        current_filter_set = set(
-                            self.selected_media_type_details.get("input_ext", []))
-
-                    if not self.selected_media_type_details or \
-                       not current_filter_set or \
-                       item_type_in_table in current_filter_set:
-                        files_checked_and_active = True
-                        break
+            files_checked_and_active = any(True for _ in self._iter_active_checked_rows())
 
         output_folder_ok = True
-        if self.selected_media_type_details and self.selected_media_type_details.get("requires_output_folder", False):
+        if self._media_requires_output_folder:
             if self.output_same_folder_checkbox and not self.output_same_folder_checkbox.isChecked():
                 if self.output_folder_path_display and not self.output_folder_path_display.text():
                     output_folder_ok = False
@@ -941,51 +1074,45 @@ class ConverterWindow(QMainWindow):
     def _on_table_select_all(self):
         if not self.file_table:
             return
-        for i in range(len(self.table_data)):
-            item_chk_widget = self.file_table.item(i, COL_CHECK)
-            if item_chk_widget and item_chk_widget.flags() & Qt.ItemFlag.ItemIsEnabled:
-                self.table_data[i][COL_CHECK] = True
-                item_chk_widget.setCheckState(Qt.CheckState.Checked)
-        self.update_convert_button_state()
+        for i, row in enumerate(self.table_data):
+            if self.file_table_model.is_row_enabled(i):
+                row.checked = True
+        self.file_table_model.notify_check_states_changed()
+        self._schedule_state_update()
 
     @Slot()
     def _on_table_clear_selection(self):
         if not self.file_table:
             return
-        for i in range(len(self.table_data)):
-            self.table_data[i][COL_CHECK] = False
-            item = self.file_table.item(i, COL_CHECK)
-            if item:
-                item.setCheckState(Qt.CheckState.Unchecked)
-        self.update_convert_button_state()
+        for row in self.table_data:
+            row.checked = False
+        self.file_table_model.notify_check_states_changed()
+        self._schedule_state_update()
 
     @Slot()
     def _on_table_remove_selected(self):
-        removed_count = 0
-        for i in range(len(self.table_data) - 1, -1, -1):
-            if self.table_data[i][COL_CHECK]:
-                del self.table_data[i]
-                removed_count += 1
+        removed_rows = self.file_table_model.remove_checked_rows()
+        for row in removed_rows:
+            self._table_paths.discard(row.path)
+        removed_count = len(removed_rows)
 
         if removed_count > 0:
-            self.update_table_widget()
-            if self.statusbar:
-                self.statusbar.showMessage(
-                    f"{removed_count} item(s) removed. {len(self.table_data)} remaining.")
-        self.update_convert_button_state()
+            self._set_status(
+                f"{removed_count} item(s) removed. {len(self.table_data)} remaining.")
+        self._schedule_state_update()
 
     @Slot()
     def open_settings(self):
-        dialog = SettingsDialog(self.ui)
-        if dialog.exec():
-            if self.statusbar:
-                self.statusbar.showMessage("Settings updated and saved.")
-            if self.delete_input_checkbox:
-                self.delete_input_checkbox.setChecked(
-                    config.settings.DELETE_SOURCE_ON_SUCCESS)
+        # Built on first use and kept; later opens only reload the current settings into it.
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self.ui)
+        else:
+            self._settings_dialog.load_from_config()
+        if self._settings_dialog.exec():
+            self._sync_delete_input_checkbox()
+            self._set_status("Settings updated and saved.")
         else:
-            if self.statusbar:
-                self.statusbar.showMessage("Settings dialog cancelled.")
+            self._set_status("Settings dialog cancelled.")
 
     @Slot()
     def add_files(self):
@@ -1020,33 +1147,46 @@ class ConverterWindow(QMainWindow):
 
     @Slot()
     def clear_input_list(self):
-        self.table_data = []
+        self.table_data.clear()
+        self._table_paths.clear()
         self.update_table_widget()
-        if self.statusbar:
-            self.statusbar.showMessage("Input list cleared.")
-        self.update_convert_button_state()
+        self._set_status("Input list cleared.")
+        self._schedule_state_update()
+
+    @Slot(QModelIndex)
+    def _on_file_table_pressed(self, index):
+        row = index.row()
+        if index.column() == COL_CHECK and 0 <= row < len(self.table_data):
+            self._pressed_check_state = (row, self.table_data[row].checked)
+        else:
+            self._pressed_check_state = None
 
-    @Slot(int, int)
-    def handle_cell_click(self, row, column):
-        if not self.file_table or column != COL_CHECK or not (0 <= row < len(self.table_data)):
+    def handle_cell_click(self, index):
+        row = index.row()
+        if not self.file_table or index.column() != COL_CHECK or not (0 <= row < len(self.table_data)):
             return
 
-        item_flags = self.file_table.item(row, column).flags()
-        if item_flags & Qt.ItemFlag.ItemIsEnabled:
-            self.table_data[row][COL_CHECK] = not self.table_data[row][COL_CHECK]
-            self.file_table.item(row, COL_CHECK).setCheckState(
-                Qt.CheckState.Checked if self.table_data[row][COL_CHECK] else Qt.CheckState.Unchecked
-            )
-            self.update_convert_button_state()
+        if self.file_table_model.is_row_enabled(row):
+            # Clicks on the indicator are already toggled by the view's delegate through setData();
+            # only clicks elsewhere in the cell, which leave the state as it was at press time, toggle here.
+            if self._pressed_check_state != (row, self.table_data[row].checked):
+                return
+            self.file_table_model.setData(
+                index,
+                Qt.CheckState.Unchecked if self.table_data[row].checked else Qt.CheckState.Checked,
+                Qt.ItemDataRole.CheckStateRole)
         else:
-            if self.statusbar:
-                self.statusbar.showMessage(
-                    "This file type is currently filtered out. Adjust input filters to select.", 3000)
+            self._set_status(
+                "This file type is currently filtered out. Adjust input filters to select.", 3000)
 
     @Slot(bool)
     def toggle_log_visibility(self, checked):
         if self.log_output_text:
-            self.log_output_text.setVisible(checked)
+            # isHidden() reflects the explicit show/hide state even while the window itself is not shown.
+            if self.log_output_text.isHidden() == checked:
+                self.log_output_text.setVisible(checked)
+            if checked:
+                self._flush_log_output()
         if self.clear_log_button:
             self.clear_log_button.setVisible(checked)
         if self.toggle_log_button:
@@ -1055,37 +1195,104 @@ class ConverterWindow(QMainWindow):
 
     @Slot()
     def clear_log(self):
+        self._pending_log_lines.clear()
         if self.log_output_text:
             self.log_output_text.clear()
 
     @Slot(str)
     def handle_output_update(self, message):
-        if self.log_output_text:
-            self.log_output_text.append(message)
+        self._queue_log_line(message)
 
     @Slot(str)
     def handle_error_update(self, message):
-        if self.log_output_text:
-            self.log_output_text.append(f"<font color='red'>{message}</font>")
+        self._queue_log_line(message, "red")
+
+    def _emit_or_print(self, message, fallback_color_code=None, is_error=False):
+        """
+        Queues a GUI-side message for the batched log, or prints it via utils when there is no log widget.
+        """
+        if not self.log_output_text:
+            utils._emit_or_print(message, fallback_color_code=fallback_color_code, is_error=is_error)
+            return
+        color = "red" if is_error else LOG_TEXT_COLORS.get(fallback_color_code, fallback_color_code)
+        if QThread.currentThread() != self.thread():
+            # The log buffer and its timer belong to the GUI thread; hand the line over through the event loop.
+            QMetaObject.invokeMethod(self, "_queue_log_line_from_thread", Qt.ConnectionType.QueuedConnection,
+                                     Q_ARG(str, message), Q_ARG(str, color or ""))
+            return
+        self._queue_log_line(message, color)
+
+    @Slot(str, str)
+    def _queue_log_line_from_thread(self, text, color):
+        self._queue_log_line(text, color or None)
+
+    def _queue_log_line(self, text, color=None, bold=False):
+        """Buffers a plain-text log line; the buffer is flushed by a single-shot timer."""
+        self._pending_log_lines.append((text, color, bold))
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _log_char_format(self, color, bold):
+        """Returns the cached character format for a (color, bold) log style."""
+        char_format = self._log_char_formats.get((color, bold))
+        if char_format is None:
+            char_format = QTextCharFormat()
+            if color:
+                char_format.setForeground(QColor(color))
+            if bold:
+                char_format.setFontWeight(QFont.Weight.Bold)
+            self._log_char_formats[(color, bold)] = char_format
+        return char_format
+
+    @Slot()
+    def _flush_log_output(self):
+        """Inserts all buffered log lines into the log widget in a single edit block."""
+        self._log_flush_timer.stop()
+        if not self._pending_log_lines:
+            return
+        if not self.log_output_text:
+            self._pending_log_lines.clear()
+            return
+        if self.log_output_text.isHidden():
+            # The bounded buffer keeps the latest lines; they are written in one pass once the log is shown.
+            return
+
+        scroll_bar = self.log_output_text.verticalScrollBar()
+        was_at_bottom = scroll_bar.value() == scroll_bar.maximum()
+
+        document = self.log_output_text.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        needs_new_block = not document.isEmpty()
+        # Runs of lines usually share a style, so the format is looked up only when the style changes.
+        last_style = char_format = None
+        for text, color, bold in self._pending_log_lines:
+            if needs_new_block:
+                cursor.insertBlock()
+            if (color, bold) != last_style:
+                last_style = (color, bold)
+                char_format = self._log_char_format(color, bold)
+            cursor.insertText(text, char_format)
+            needs_new_block = True
+        cursor.endEditBlock()
+        self._pending_log_lines.clear()
+
+        if was_at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
 
     def process_added_paths(self, paths, from_add_files_dialog=False, dialog_filter_exts=None):
         is_recursive = self.recursive_checkbox.isChecked(
         ) if self.recursive_checkbox else False
         newly_added_count = 0
-        current_paths_in_table = {row_data[COL_PATH]
-                                  for row_data in self.table_data}
+        current_paths_in_table = self._table_paths
 
-        valid_exts_for_adding = set()
         if from_add_files_dialog and dialog_filter_exts:
             valid_exts_for_adding = dialog_filter_exts
-        elif self.active_input_filters:
-            valid_exts_for_adding = self.active_input_filters
-        elif self.selected_media_type_details:
-            valid_exts_for_adding = set(
-                self.selected_media_type_details.get("input_ext", []))
+        elif self.active_input_filters or self.selected_media_type_details:
+            valid_exts_for_adding = self._current_valid_exts
         else:
-            valid_exts_for_adding = set(
-                menu_definitions.ALL_VALID_INPUT_EXTENSIONS)
+            valid_exts_for_adding = menu_definitions.ALL_VALID_INPUT_EXTENSIONS_SET
 
         ignored_files_log = []
 
@@ -1100,115 +1307,77 @@ class ConverterWindow(QMainWindow):
                 if (not valid_exts_for_adding or file_ext_lower in valid_exts_for_adding) and \
                    item_path not in current_paths_in_table:
                     self.table_data.append(
-                        [True, item_path, file_ext_lower.upper()])
+                        FileRow(True, item_path, file_ext_lower))
+                    current_paths_in_table.add(item_path)
                     newly_added_count += 1
                 elif item_path not in current_paths_in_table:
                     ignored_files_log.append(os.path.basename(
                         item_path) + f" (type '.{file_ext_lower}' not in current add filter)")
 
             elif os.path.isdir(item_path):
-                for f_path in self._scan_folder(item_path, is_recursive, valid_exts_for_adding):
-                    if f_path not in current_paths_in_table:
-                        file_ext_lower = os.path.splitext(
-                            f_path)[1].lower().lstrip('.')
-                        self.table_data.append(
-                            [True, f_path, file_ext_lower.upper()])
-                        newly_added_count += 1
-
-        if ignored_files_log and self.log_output_text:
-            self.log_output_text.append(
-                f"<font color='orange'>WARNING: Files ignored during add (type mismatch or duplicate): {', '.join(ignored_files_log)}</font>")
+                self._start_folder_scan(item_path, is_recursive, valid_exts_for_adding)
 
+        if ignored_files_log:
+            self._emit_or_print(
+                f"WARNING: Files ignored during add (type mismatch or duplicate): {', '.join(ignored_files_log)}",
+                fallback_color_code="yellow")
+
+        if newly_added_count > 0 or not self._active_folder_scans:
+            self._finish_adding_paths(newly_added_count)
+
+    def _finish_adding_paths(self, newly_added_count):
         if newly_added_count > 0:
-            self.table_data.sort(key=lambda x: x[COL_PATH])
+            self.table_data.sort(key=lambda x: x.path)
             self.update_table_widget()
 
-        if self.statusbar:
-            self.statusbar.showMessage(
-                f"{len(self.table_data)} file(s) in list. ({newly_added_count} added).")
-        self.update_convert_button_state()
+        self._set_status(
+            f"{len(self.table_data)} file(s) in list. ({newly_added_count} added).")
+        self._schedule_state_update()
 
-    def _scan_folder(self, folder_path, recursive, valid_extensions_for_scan):
-        found = []
+    def _start_folder_scan(self, folder_path, recursive, valid_extensions_for_scan):
+        """Scans a folder on the thread pool; matches are added in _on_folder_scan_results."""
         norm_folder = os.path.normpath(folder_path)
-        if not os.path.isdir(norm_folder):
-            return found
-
         norm_temp_main_dir = os.path.normpath(config.settings.MAIN_TEMP_DIR)
         if norm_folder.startswith(norm_temp_main_dir):
-            if self.log_output_text:
-                self.log_output_text.append(
-                    f"<font color='orange'>Skipping scan of temp directory: {norm_folder}</font>")
-            return found
-
-        for r, dirs, fs in os.walk(norm_folder):
-            norm_r = os.path.normpath(r)
-            if '_processing_temps_' in norm_r or norm_r.startswith(norm_temp_main_dir):
-                dirs[:] = []
-                continue
+            self._emit_or_print(
+                f"Skipping scan of temp directory: {norm_folder}", fallback_color_code="yellow")
+            return
 
-            for f_item in fs:
-                fp = os.path.join(norm_r, f_item)
-                if os.path.isfile(fp):
-                    ext_lower = os.path.splitext(f_item)[1].lower().lstrip('.')
-                    if not valid_extensions_for_scan or ext_lower in valid_extensions_for_scan:
-                        found.append(os.path.normpath(fp))
-            if not recursive:
-                break
-        return found
+        scan = FolderScanRunnable(
+            norm_folder, recursive, valid_extensions_for_scan, norm_temp_main_dir)
+        scan.signals.results_ready.connect(
+            self._on_folder_scan_results, Qt.ConnectionType.QueuedConnection)
+        self._active_folder_scans.add(scan.signals)
+        self._set_status(f"Scanning folder: {norm_folder} ...")
+        QThreadPool.globalInstance().start(scan)
+
+    @Slot(list)
+    def _on_folder_scan_results(self, found_paths):
+        self._active_folder_scans.discard(self.sender())
+        current_paths_in_table = self._table_paths
+        newly_added_count = 0
+        for f_path in found_paths:
+            if f_path not in current_paths_in_table:
+                file_ext_lower = os.path.splitext(f_path)[1].lower().lstrip('.')
+                self.table_data.append(FileRow(True, f_path, file_ext_lower))
+                current_paths_in_table.add(f_path)
+                newly_added_count += 1
+        self._finish_adding_paths(newly_added_count)
 
     def update_table_widget(self):
         if not self.file_table:
             return
-
-        self.file_table.setRowCount(0)
-        self.file_table.setRowCount(len(self.table_data))
-
-        for r_idx, r_data in enumerate(self.table_data):
-            chk_state_from_model, path, type_s_from_model = r_data
-
-            chk_item = QTableWidgetItem()
-            chk_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable |
-                              Qt.ItemFlag.ItemIsEnabled)
-            chk_item.setCheckState(
-                Qt.CheckState.Checked if chk_state_from_model else Qt.CheckState.Unchecked)
-            self.file_table.setItem(r_idx, COL_CHECK, chk_item)
-
-            self.file_table.setItem(r_idx, COL_PATH, QTableWidgetItem(path))
-
-            type_item = QTableWidgetItem(type_s_from_model)
-            type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.file_table.setItem(r_idx, COL_TYPE, type_item)
-
+        # The model reads table_data directly, so a rebuild is a single reset.
+        self.file_table_model.refresh()
         self._apply_filter_to_table()
 
-    def set_row_enabled_state(self, r_idx, enabled):
-        if not self.file_table or not (0 <= r_idx < self.file_table.rowCount()):
-            return
-
-        dis_color = self.palette().color(QPalette.ColorGroup.Disabled,
-                                         QPalette.ColorRole.WindowText)
-        en_color = self.palette().color(QPalette.ColorGroup.Normal,
-                                        QPalette.ColorRole.WindowText)
-
-        for c_idx in range(self.file_table.columnCount()):
-            item = self.file_table.item(r_idx, c_idx)
-            if item:
-                current_flags = item.flags()
-                if enabled:
-                    item.setFlags(current_flags | Qt.ItemFlag.ItemIsEnabled)
-                    item.setForeground(en_color)
-                else:
-                    item.setFlags(current_flags & ~Qt.ItemFlag.ItemIsEnabled)
-                    item.setForeground(dis_color)
-
     @Slot()
     def close_application(self):
-        print("DEBUG: close_application() called (e.g., from File > Exit).")
+        logger.debug("close_application() called (e.g., from File > Exit).")
         self.close()
 
     def closeEvent(self, event: QCloseEvent):
-        print("DEBUG: ConverterWindow.closeEvent() triggered.")
+        logger.debug("ConverterWindow.closeEvent() triggered.")
         app = QApplication.instance()
 
         if self.conversion_thread and self.conversion_thread.isRunning():
@@ -1220,26 +1389,31 @@ class ConverterWindow(QMainWindow):
                 QMessageBox.StandardButton.No
             )
             if reply == QMessageBox.StandardButton.Yes:
-                print("DEBUG: User confirmed exit during active conversion.")
+                logger.debug("User confirmed exit during active conversion.")
                 self._ensure_thread_stopped()  # Use the new method
                 event.accept()
                 if app:
-                    print(
-                        "DEBUG: Calling app.quit() from closeEvent (conversion was active).")
+                    logger.debug("Calling app.quit() from closeEvent (conversion was active).")
                     app.quit()
             else:
-                print("DEBUG: User cancelled exit during active conversion.")
+                logger.debug("User cancelled exit during active conversion.")
                 event.ignore()
         else:
-            print("DEBUG: No active conversion, accepting close event.")
+            logger.debug("No active conversion, accepting close event.")
             event.accept()
             if app:
-                print("DEBUG: Calling app.quit() from closeEvent (no conversion).")
+                logger.debug("Calling app.quit() from closeEvent (no conversion).")
                 app.quit()
 
 
 def run_gui():
-    print("DEBUG: Initializing QApplication in gui_main_window.run_gui()...")
+    logging.basicConfig(
+        level=logging.DEBUG if config.settings.DEBUG_MODE else logging.WARNING,
+        format="%(levelname)s: %(message)s")
+    logger.debug("Initializing QApplication in gui_main_window.run_gui()...")
+    # Every widget sits in a layout and none overlap, so Qt's per-update opaque-sibling
+    # region subtraction is pure overhead when the conversion toggles enable many widgets.
+    os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
     app = QApplication.instance()
     if not app:
         app = QApplication(sys.argv)
@@ -1253,34 +1427,38 @@ def run_gui():
         __file__), "assets", "qt", "app_icon.ico")
     if os.path.exists(icon_path):
         app.setWindowIcon(QIcon(icon_path))  # Set the application-wide icon
-        print(f"DEBUG: Application icon set from {icon_path}")
+        logger.debug("Application icon set from %s", icon_path)
     else:
-        print(f"DEBUG: Application icon not found at {icon_path}. Using default system icon.")
+        logger.debug("Application icon not found at %s. Using default system icon.", icon_path)
 
-    print(
-        f"DEBUG (gui_main_window): Config SUBPROCESS_TIMEOUT: {config.settings.SUBPROCESS_TIMEOUT}")
+    logger.debug("Config SUBPROCESS_TIMEOUT: %s", config.settings.SUBPROCESS_TIMEOUT)
 
-    print("DEBUG: Creating ConverterWindow instance...")
+    logger.debug("Creating ConverterWindow instance...")
     window_wrapper = ConverterWindow()
 
     if window_wrapper.ui:
-        print("DEBUG: Showing main window (window_wrapper.ui)...")
+        logger.debug("Showing main window (window_wrapper.ui)...")
         window_wrapper.ui.show()
 
-        print("DEBUG: Entering Qt event loop (app.exec())...")
+        logger.debug("Entering Qt event loop (app.exec())...")
         exit_code = app.exec()
-        print(
-            f"DEBUG: Qt event loop finished. app.exec() returned: {exit_code}")
-
-        active_threads = threading.enumerate()
-        print(f"DEBUG: Active threads before sys.exit() ({len(active_threads)}):")
-        for thread_item in active_threads:
-            print(f"  - Name: {thread_item.name}, Daemon: {thread_item.daemon}, Alive: {thread_item.is_alive()}")
-            if thread_item != threading.main_thread() and thread_item.is_alive() and not thread_item.daemon:
-                print(f"WARNING: Non-daemon thread '{thread_item.name}' is still alive. Python might hang if not handled.")
-
-        print(f"DEBUG: Calling sys.exit({exit_code}). Python process should terminate if all non-daemon threads are done.")
+        logger.debug("Qt event loop finished. app.exec() returned: %s", exit_code)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            active_threads = threading.enumerate()
+            # Collected into one record instead of one per thread.
+            thread_report = [f"Active threads before sys.exit() ({len(active_threads)}):"]
+            for thread_item in active_threads:
+                thread_report.append(
+                    f"  - Name: {thread_item.name}, Daemon: {thread_item.daemon}, Alive: {thread_item.is_alive()}")
+                if thread_item != threading.main_thread() and thread_item.is_alive() and not thread_item.daemon:
+                    thread_report.append(
+                        f"WARNING: Non-daemon thread '{thread_item.name}' is still alive. Python might hang if not handled.")
+            logger.debug("\n".join(thread_report))
+
+        logger.debug("Calling sys.exit(%s). Python process should terminate if all non-daemon threads are done.",
+                     exit_code)
         sys.exit(exit_code)
     else:
-        print("DEBUG: Exiting due to UI load failure in ConverterWindow initialization.")
+        logger.debug("Exiting due to UI load failure in ConverterWindow initialization.")
         sys.exit(-1)
@@ -1,11 +1,13 @@
 # converter_tools/gui_settings.py
 
 import os
+import stat
 try:
     from PySide6.QtWidgets import (
         QDialog, QCheckBox, QLineEdit, QPushButton, QComboBox, QSpinBox,
-        QDialogButtonBox, QFileDialog, QMessageBox, QVBoxLayout
+        QDialogButtonBox, QFileDialog, QMessageBox, QVBoxLayout, QWidget
     )
+    from PySide6.QtCore import QBuffer, QByteArray
     from PySide6.QtGui import QIntValidator # Moved import here
     from PySide6.QtUiTools import QUiLoader
 except ImportError as e:
@@ -21,22 +23,177 @@ except ImportError as e:
 
 import config
 
+# (text, userData) entries for the settings combo boxes, built once per process.
+PROCESSOR_COMBO_ITEMS = (("Auto", "auto"),) + tuple((f"{i} core(s)", i) for i in range(1, config.CPU_COUNT + 1))
+DOLPHINTOOL_RVZ_BLOCKSIZE_ITEMS = (
+    ("32 KiB", 32768), ("64 KiB", 65536), ("128 KiB", 131072), ("256 KiB", 262144),
+    ("512 KiB", 524288), ("1 MiB", 1048576), ("2 MiB", 2097152),
+)
+DOLPHINTOOL_RVZ_COMPRESSION_ITEMS = (
+    ("No compression", "none"), ("bzip2 (slow)", "bzip2"), ("LZMA (slow)", "lzma"),
+    ("LZMA2 (slow)", "lzma2"), ("Zstandard (default)", "zstd"),
+)
+DOLPHINTOOL_WIA_COMPRESSION_ITEMS = (
+    ("No compression", "none"), ("Purge", "purge"), ("bzip2 (slow)", "bzip2"),
+    ("LZMA (slow)", "lzma"), ("LZMA2 (slow)", "lzma2"),
+)
+DOLPHINTOOL_GCZ_BLOCKSIZE_ITEMS = (("32 KiB", 32768), ("64 KiB", 65536), ("128 KiB", 131072), ("256 KiB", 262144))
+
+UI_FILE_PATH = os.path.join(os.path.dirname(__file__), "assets", "qt", "widget_settings.ui")
+
+# (object name, widget type) of every widget_settings.ui widget the dialog binds to an attribute.
+SETTINGS_WIDGETS = (
+    ("copy_locally_checkbox", QCheckBox),
+    ("temp_dir_edit", QLineEdit),
+    ("temp_dir_browse_button", QPushButton),
+    ("chdman_threaded_processors_combo_box", QComboBox),
+    ("chdman_cd_hunksize_check_box", QCheckBox),
+    ("chdman_cd_hunksize_line_edit", QLineEdit),
+    ("chdman_cd_compression_check_box", QCheckBox),
+    ("chdman_cd_compression_line_edit", QLineEdit),
+    ("chdman_dvd_hunksize_check_box", QCheckBox),
+    ("chdman_dvd_hunksize_line_edit", QLineEdit),
+    ("chdman_dvd_compression_check_box", QCheckBox),
+    ("chdman_dvd_compression_line_edit", QLineEdit),
+    ("chdman_laserdisc_hunksize_check_box", QCheckBox),
+    ("chdman_laserdisc_hunksize_line_edit", QLineEdit),
+    ("chdman_laserdisc_compression_check_box", QCheckBox),
+    ("chdman_laserdisc_compression_line_edit", QLineEdit),
+    ("chdman_laserdisc_startframe_check_box", QCheckBox),
+    ("chdman_laserdisc_startframe_line_edit", QLineEdit),
+    ("chdman_laserdisc_inputframes_check_box", QCheckBox),
+    ("chdman_laserdisc_inputframes_line_edit", QLineEdit),
+    ("chdman_harddisk_hunksize_check_box", QCheckBox),
+    ("chdman_harddisk_hunksize_line_edit", QLineEdit),
+    ("chdman_harddisk_compression_check_box", QCheckBox),
+    ("chdman_harddisk_compression_line_edit", QLineEdit),
+    ("chdman_harddisk_sector_check_box", QCheckBox),
+    ("chdman_harddisk_sector_line_edit", QLineEdit),
+    ("chdman_harddisk_size_check_box", QCheckBox),
+    ("chdman_harddisk_size_line_edit", QLineEdit),
+    ("chdman_harddisk_chs_check_box", QCheckBox),
+    ("chdman_harddisk_chs_c_line_edit", QLineEdit),
+    ("chdman_harddisk_chs_h_line_edit", QLineEdit),
+    ("chdman_harddisk_chs_s_line_edit", QLineEdit),
+    ("chdman_harddisk_template_check_box", QCheckBox),
+    ("chdman_harddisk_template_line_edit", QLineEdit),
+    ("chdman_raw_hunksize_check_box", QCheckBox),
+    ("chdman_raw_hunksize_line_edit", QLineEdit),
+    ("chdman_raw_compression_check_box", QCheckBox),
+    ("chdman_raw_compression_line_edit", QLineEdit),
+    ("chdman_verify_fix_checkbox", QCheckBox),
+    ("dolphintool_rvz_blocksize_combo_box", QComboBox),
+    ("dolphintool_rvz_compression_combo_box", QComboBox),
+    ("dolphintool_rvz_level_spin_box", QSpinBox),
+    ("dolphintool_wia_compression_combo_box", QComboBox),
+    ("dolphintool_wia_level_spin_box", QSpinBox),
+    ("dolphintool_gcz_blocksize_combo_box", QComboBox),
+    ("button_box", QDialogButtonBox),
+)
+
+# (widget attribute, config.settings key, kind) in load order; each check box precedes its line edit.
+# *_text kinds fall back to DEFAULT_SETTINGS when left empty, optional_*_text kinds to None.
+SETTINGS_WIDGET_BINDINGS = (
+    ("chdman_cd_hunksize_check_box", "CHDMAN_CD_USE_CUSTOM_HUNKS", "check"),
+    ("chdman_cd_hunksize_line_edit", "CHDMAN_CD_HUNKS", "int_text"),
+    ("chdman_cd_compression_check_box", "CHDMAN_CD_USE_CUSTOM_COMPRESSION", "check"),
+    ("chdman_cd_compression_line_edit", "CHDMAN_CD_COMPRESSION_TYPES", "str_text"),
+    ("chdman_dvd_hunksize_check_box", "CHDMAN_DVD_USE_CUSTOM_HUNKS", "check"),
+    ("chdman_dvd_hunksize_line_edit", "CHDMAN_DVD_HUNKS", "int_text"),
+    ("chdman_dvd_compression_check_box", "CHDMAN_DVD_USE_CUSTOM_COMPRESSION", "check"),
+    ("chdman_dvd_compression_line_edit", "CHDMAN_DVD_COMPRESSION_TYPES", "str_text"),
+    ("chdman_laserdisc_hunksize_check_box", "CHDMAN_LD_USE_CUSTOM_HUNKS", "check"),
+    ("chdman_laserdisc_hunksize_line_edit", "CHDMAN_LD_HUNKS", "int_text"),
+    ("chdman_laserdisc_compression_check_box", "CHDMAN_LD_USE_CUSTOM_COMPRESSION", "check"),
+    ("chdman_laserdisc_compression_line_edit", "CHDMAN_LD_COMPRESSION_TYPES", "str_text"),
+    ("chdman_laserdisc_startframe_check_box", "CHDMAN_LD_USE_INPUT_START_FRAME", "check"),
+    ("chdman_laserdisc_startframe_line_edit", "CHDMAN_LD_INPUT_START_FRAME", "optional_int_text"),
+    ("chdman_laserdisc_inputframes_check_box", "CHDMAN_LD_USE_INPUT_FRAMES", "check"),
+    ("chdman_laserdisc_inputframes_line_edit", "CHDMAN_LD_INPUT_FRAMES", "optional_int_text"),
+    ("chdman_harddisk_hunksize_check_box", "CHDMAN_HD_USE_CUSTOM_HUNKS", "check"),
+    ("chdman_harddisk_hunksize_line_edit", "CHDMAN_HD_HUNKS", "int_text"),
+    ("chdman_harddisk_compression_check_box", "CHDMAN_HD_USE_CUSTOM_COMPRESSION", "check"),
+    ("chdman_harddisk_compression_line_edit", "CHDMAN_HD_COMPRESSION_TYPES", "str_text"),
+    ("chdman_harddisk_sector_check_box", "CHDMAN_HD_USE_SECTOR_SIZE", "check"),
+    ("chdman_harddisk_sector_line_edit", "CHDMAN_HD_SECTOR_SIZE", "optional_int_text"),
+    ("chdman_harddisk_size_check_box", "CHDMAN_HD_USE_SIZE", "check"),
+    ("chdman_harddisk_size_line_edit", "CHDMAN_HD_SIZE", "optional_str_text"),
+    ("chdman_harddisk_chs_check_box", "CHDMAN_HD_USE_CHS", "check"),
+    ("chdman_harddisk_chs_c_line_edit", "CHDMAN_HD_CHS_C", "optional_int_text"),
+    ("chdman_harddisk_chs_h_line_edit", "CHDMAN_HD_CHS_H", "optional_int_text"),
+    ("chdman_harddisk_chs_s_line_edit", "CHDMAN_HD_CHS_S", "optional_int_text"),
+    ("chdman_harddisk_template_check_box", "CHDMAN_HD_USE_TEMPLATE", "check"),
+    ("chdman_harddisk_template_line_edit", "CHDMAN_HD_TEMPLATE_PATH", "optional_str_text"),
+    ("chdman_raw_hunksize_check_box", "CHDMAN_RAW_USE_CUSTOM_HUNKS", "check"),
+    ("chdman_raw_hunksize_line_edit", "CHDMAN_RAW_HUNKS", "int_text"),
+    ("chdman_raw_compression_check_box", "CHDMAN_RAW_USE_CUSTOM_COMPRESSION", "check"),
+    ("chdman_raw_compression_line_edit", "CHDMAN_RAW_COMPRESSION_TYPES", "str_text"),
+    ("chdman_verify_fix_checkbox", "CHDMAN_VERIFY_FIX", "check"),
+    ("dolphintool_rvz_blocksize_combo_box", "DOLPHINTOOL_RVZ_BLOCKSIZE", "combo"),
+    ("dolphintool_rvz_compression_combo_box", "DOLPHINTOOL_RVZ_COMPRESSION_TYPE", "combo"),
+    ("dolphintool_rvz_level_spin_box", "DOLPHINTOOL_RVZ_COMPRESSION_LEVEL", "spin"),
+    ("dolphintool_wia_compression_combo_box", "DOLPHINTOOL_WIA_COMPRESSION_TYPE", "combo"),
+    ("dolphintool_wia_level_spin_box", "DOLPHINTOOL_WIA_COMPRESSION_LEVEL", "spin"),
+    ("dolphintool_gcz_blocksize_combo_box", "DOLPHINTOOL_GCZ_BLOCKSIZE", "combo"),
+)
+
 class SettingsDialog(QDialog):
+    _UI_BYTES = None  # Contents of widget_settings.ui, read on first construction
+
+    @classmethod
+    def _get_ui_bytes(cls):
+        """Returns the .ui file contents, reading the file only the first time; None if it is missing."""
+        if cls._UI_BYTES is None:
+            try:
+                with open(UI_FILE_PATH, "rb") as ui_file:
+                    cls._UI_BYTES = ui_file.read()
+            except OSError:
+                return None
+        return cls._UI_BYTES
+
+    _INT_VALIDATORS = None  # (non-negative, positive) validators shared by every dialog
+
+    @classmethod
+    def _get_int_validators(cls):
+        """Returns the shared integer validators; they hold no per-field state, so one pair serves all line edits."""
+        if cls._INT_VALIDATORS is None:
+            cls._INT_VALIDATORS = (QIntValidator(0, 9999999), QIntValidator(1, 9999999))
+        return cls._INT_VALIDATORS
+
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        ui_file_path = os.path.join(os.path.dirname(__file__), "assets", "qt", "widget_settings.ui") 
-        if not os.path.exists(ui_file_path):
-            QMessageBox.critical(self, "Error", f"Settings UI file not found: {ui_file_path}")
+        ui_bytes = self._get_ui_bytes()
+        if ui_bytes is None:
+            QMessageBox.critical(self, "Error", f"Settings UI file not found: {UI_FILE_PATH}")
             self.setup_fallback_ui() 
             return
 
         loader = QUiLoader()
-        self.ui_container = loader.load(ui_file_path, self) 
+        ui_buffer = QBuffer()
+        ui_buffer.setData(QByteArray(ui_bytes))
+        self.ui_container = loader.load(ui_buffer, self) 
         if not self.ui_container:
             QMessageBox.critical(self, "UI Load Error", f"Could not load widget_settings.ui: {loader.errorString()}")
             self.setup_fallback_ui()
             return
+
+        # One walk of the loaded tree builds a name -> widget map instead of a findChild() search per widget.
+        widgets_by_name = {}
+        for widget in self.ui_container.findChildren(QWidget):
+            widgets_by_name.setdefault(widget.objectName(), widget)
+        # Every widget is checked here once, so the rest of the dialog can use them without None guards.
+        missing_names = [attr_name for attr_name, widget_type in SETTINGS_WIDGETS
+                         if not isinstance(widgets_by_name.get(attr_name), widget_type)]
+        if missing_names:
+            QMessageBox.critical(self, "Settings UI Error",
+                                 f"widget_settings.ui is missing these widgets: {', '.join(missing_names)}")
+            self.ui_container.deleteLater()
+            self.ui_container = None
+            self.setup_fallback_ui()
+            return
+        for attr_name, _ in SETTINGS_WIDGETS:
+            setattr(self, attr_name, widgets_by_name[attr_name])
         
         main_layout = QVBoxLayout(self)
         main_layout.addWidget(self.ui_container)
@@ -44,89 +201,29 @@ class SettingsDialog(QDialog):
         self.setWindowTitle("Converter Settings")
         self.resize(720, 610)
 
-        # Find Widgets
-        self.copy_locally_checkbox = self.ui_container.findChild(QCheckBox, "copy_locally_checkbox")
-        self.temp_dir_edit = self.ui_container.findChild(QLineEdit, "temp_dir_edit")
-        self.temp_dir_browse_button = self.ui_container.findChild(QPushButton, "temp_dir_browse_button")
-        self.chdman_threaded_processors_combo_box = self.ui_container.findChild(QComboBox, "chdman_threaded_processors_combo_box")
-        self.chdman_cd_hunksize_check_box = self.ui_container.findChild(QCheckBox, "chdman_cd_hunksize_check_box")
-        self.chdman_cd_hunksize_line_edit = self.ui_container.findChild(QLineEdit, "chdman_cd_hunksize_line_edit")
-        self.chdman_cd_compression_check_box = self.ui_container.findChild(QCheckBox, "chdman_cd_compression_check_box")
-        self.chdman_cd_compression_line_edit = self.ui_container.findChild(QLineEdit, "chdman_cd_compression_line_edit")
-        self.chdman_dvd_hunksize_check_box = self.ui_container.findChild(QCheckBox, "chdman_dvd_hunksize_check_box")
-        self.chdman_dvd_hunksize_line_edit = self.ui_container.findChild(QLineEdit, "chdman_dvd_hunksize_line_edit")
-        self.chdman_dvd_compression_check_box = self.ui_container.findChild(QCheckBox, "chdman_dvd_compression_check_box")
-        self.chdman_dvd_compression_line_edit = self.ui_container.findChild(QLineEdit, "chdman_dvd_compression_line_edit")
-        self.chdman_laserdisc_hunksize_check_box = self.ui_container.findChild(QCheckBox, "chdman_laserdisc_hunksize_check_box")
-        self.chdman_laserdisc_hunksize_line_edit = self.ui_container.findChild(QLineEdit, "chdman_laserdisc_hunksize_line_edit")
-        self.chdman_laserdisc_compression_check_box = self.ui_container.findChild(QCheckBox, "chdman_laserdisc_compression_check_box")
-        self.chdman_laserdisc_compression_line_edit = self.ui_container.findChild(QLineEdit, "chdman_laserdisc_compression_line_edit")
-        self.chdman_laserdisc_startframe_check_box = self.ui_container.findChild(QCheckBox, "chdman_laserdisc_startframe_check_box")
-        self.chdman_laserdisc_startframe_line_edit = self.ui_container.findChild(QLineEdit, "chdman_laserdisc_startframe_line_edit")
-        self.chdman_laserdisc_inputframes_check_box = self.ui_container.findChild(QCheckBox, "chdman_laserdisc_inputframes_check_box")
-        self.chdman_laserdisc_inputframes_line_edit = self.ui_container.findChild(QLineEdit, "chdman_laserdisc_inputframes_line_edit")
-        self.chdman_harddisk_hunksize_check_box = self.ui_container.findChild(QCheckBox, "chdman_harddisk_hunksize_check_box")
-        self.chdman_harddisk_hunksize_line_edit = self.ui_container.findChild(QLineEdit, "chdman_harddisk_hunksize_line_edit")
-        self.chdman_harddisk_compression_check_box = self.ui_container.findChild(QCheckBox, "chdman_harddisk_compression_check_box")
-        self.chdman_harddisk_compression_line_edit = self.ui_container.findChild(QLineEdit, "chdman_harddisk_compression_line_edit")
-        self.chdman_harddisk_sector_check_box = self.ui_container.findChild(QCheckBox, "chdman_harddisk_sector_check_box")
-        self.chdman_harddisk_sector_line_edit = self.ui_container.findChild(QLineEdit, "chdman_harddisk_sector_line_edit")
-        self.chdman_harddisk_size_check_box = self.ui_container.findChild(QCheckBox, "chdman_harddisk_size_check_box")
-        self.chdman_harddisk_size_line_edit = self.ui_container.findChild(QLineEdit, "chdman_harddisk_size_line_edit")
-        self.chdman_harddisk_chs_check_box = self.ui_container.findChild(QCheckBox, "chdman_harddisk_chs_check_box")
-        self.chdman_harddisk_chs_c_line_edit = self.ui_container.findChild(QLineEdit, "chdman_harddisk_chs_c_line_edit")
-        self.chdman_harddisk_chs_h_line_edit = self.ui_container.findChild(QLineEdit, "chdman_harddisk_chs_h_line_edit")
-        self.chdman_harddisk_chs_s_line_edit = self.ui_container.findChild(QLineEdit, "chdman_harddisk_chs_s_line_edit")
-        self.chdman_harddisk_template_check_box = self.ui_container.findChild(QCheckBox, "chdman_harddisk_template_check_box")
-        self.chdman_harddisk_template_line_edit = self.ui_container.findChild(QLineEdit, "chdman_harddisk_template_line_edit")
-        self.chdman_raw_hunksize_check_box = self.ui_container.findChild(QCheckBox, "chdman_raw_hunksize_check_box")
-        self.chdman_raw_hunksize_line_edit = self.ui_container.findChild(QLineEdit, "chdman_raw_hunksize_line_edit")
-        self.chdman_raw_compression_check_box = self.ui_container.findChild(QCheckBox, "chdman_raw_compression_check_box")
-        self.chdman_raw_compression_line_edit = self.ui_container.findChild(QLineEdit, "chdman_raw_compression_line_edit")
-        self.chdman_verify_fix_checkbox = self.ui_container.findChild(QCheckBox, "chdman_verify_fix_checkbox")
-        self.dolphintool_rvz_blocksize_combo_box = self.ui_container.findChild(QComboBox, "dolphintool_rvz_blocksize_combo_box")
-        self.dolphintool_rvz_compression_combo_box = self.ui_container.findChild(QComboBox, "dolphintool_rvz_compression_combo_box")
-        self.dolphintool_rvz_level_spin_box = self.ui_container.findChild(QSpinBox, "dolphintool_rvz_level_spin_box")
-        self.dolphintool_wia_compression_combo_box = self.ui_container.findChild(QComboBox, "dolphintool_wia_compression_combo_box")
-        self.dolphintool_wia_level_spin_box = self.ui_container.findChild(QSpinBox, "dolphintool_wia_level_spin_box")
-        self.dolphintool_gcz_blocksize_combo_box = self.ui_container.findChild(QComboBox, "dolphintool_gcz_blocksize_combo_box")
-        self.button_box = self.ui_container.findChild(QDialogButtonBox, "button_box") 
-
-        self._validate_widgets() 
+        self._checkbox_lineedit_links = {}  # guarded check box -> (line edits, default text, uncheck clears)
         self._setup_validators_and_interactive_logic()
         self.load_settings_to_ui()
         self._connect_signals()
 
-    def _validate_widgets(self):
-        if not self.button_box:
-            QMessageBox.critical(self, "Settings UI Error",
-                                 "The main button box (OK/Cancel) was not found in widget_settings.ui. "
-                                 "Please ensure it has the objectName 'button_box'.")
-            return False 
-        return True
-
     def _setup_validators_and_interactive_logic(self):
-        int_validator = QIntValidator(0, 9999999, self) 
-        positive_int_validator = QIntValidator(1, 9999999, self) 
-
-        if self.chdman_cd_hunksize_line_edit: self.chdman_cd_hunksize_line_edit.setValidator(int_validator)
-        if self.chdman_dvd_hunksize_line_edit: self.chdman_dvd_hunksize_line_edit.setValidator(int_validator)
-        if self.chdman_laserdisc_hunksize_line_edit: self.chdman_laserdisc_hunksize_line_edit.setValidator(int_validator)
-        if self.chdman_laserdisc_startframe_line_edit: self.chdman_laserdisc_startframe_line_edit.setValidator(int_validator)
-        if self.chdman_laserdisc_inputframes_line_edit: self.chdman_laserdisc_inputframes_line_edit.setValidator(positive_int_validator) 
-        if self.chdman_harddisk_hunksize_line_edit: self.chdman_harddisk_hunksize_line_edit.setValidator(int_validator)
-        if self.chdman_harddisk_sector_line_edit: self.chdman_harddisk_sector_line_edit.setValidator(int_validator)
-        if self.chdman_harddisk_chs_c_line_edit: self.chdman_harddisk_chs_c_line_edit.setValidator(int_validator)
-        if self.chdman_harddisk_chs_h_line_edit: self.chdman_harddisk_chs_h_line_edit.setValidator(int_validator)
-        if self.chdman_harddisk_chs_s_line_edit: self.chdman_harddisk_chs_s_line_edit.setValidator(int_validator)
-        if self.chdman_raw_hunksize_line_edit: self.chdman_raw_hunksize_line_edit.setValidator(int_validator)
+        int_validator, positive_int_validator = self._get_int_validators()
+
+        self.chdman_cd_hunksize_line_edit.setValidator(int_validator)
+        self.chdman_dvd_hunksize_line_edit.setValidator(int_validator)
+        self.chdman_laserdisc_hunksize_line_edit.setValidator(int_validator)
+        self.chdman_laserdisc_startframe_line_edit.setValidator(int_validator)
+        self.chdman_laserdisc_inputframes_line_edit.setValidator(positive_int_validator) 
+        self.chdman_harddisk_hunksize_line_edit.setValidator(int_validator)
+        self.chdman_harddisk_sector_line_edit.setValidator(int_validator)
+        self.chdman_harddisk_chs_c_line_edit.setValidator(int_validator)
+        self.chdman_harddisk_chs_h_line_edit.setValidator(int_validator)
+        self.chdman_harddisk_chs_s_line_edit.setValidator(int_validator)
+        self.chdman_raw_hunksize_line_edit.setValidator(int_validator)
         
-        if self.chdman_threaded_processors_combo_box:
-            self.chdman_threaded_processors_combo_box.clear() 
-            self.chdman_threaded_processors_combo_box.addItem("Auto", userData="auto") 
-            cpu_cores = config.CPU_COUNT # This is a module-level constant, not on settings object
-            for i in range(1, cpu_cores + 1):
-                self.chdman_threaded_processors_combo_box.addItem(f"{i} core(s)", userData=i)
+        self.chdman_threaded_processors_combo_box.clear() 
+        for text, data in PROCESSOR_COMBO_ITEMS:
+            self.chdman_threaded_processors_combo_box.addItem(text, userData=data)
         
         self._setup_chdman_options_group(
             self.chdman_cd_hunksize_check_box, self.chdman_cd_hunksize_line_edit, str(config.DEFAULT_SETTINGS["CHDMAN_CD_HUNKS"]),
@@ -159,55 +256,47 @@ class SettingsDialog(QDialog):
             self.chdman_raw_compression_check_box, self.chdman_raw_compression_line_edit, config.DEFAULT_SETTINGS["CHDMAN_RAW_COMPRESSION_TYPES"]
         )
 
-        if self.dolphintool_rvz_blocksize_combo_box:
-            self.dolphintool_rvz_blocksize_combo_box.clear()
-            items = {"32 KiB": 32768, "64 KiB": 65536, "128 KiB": 131072, "256 KiB": 262144, "512 KiB": 524288, "1 MiB": 1048576, "2 MiB": 2097152}
-            for text, data in items.items(): self.dolphintool_rvz_blocksize_combo_box.addItem(text, userData=data)
-        if self.dolphintool_rvz_compression_combo_box:
-            self.dolphintool_rvz_compression_combo_box.clear()
-            items = {"No compression": "none", "bzip2 (slow)": "bzip2", "LZMA (slow)": "lzma", "LZMA2 (slow)": "lzma2", "Zstandard (default)": "zstd"}
-            for text, data in items.items(): self.dolphintool_rvz_compression_combo_box.addItem(text, userData=data)
-            self.dolphintool_rvz_compression_combo_box.currentTextChanged.connect(self._update_dolphintool_rvz_level_spinbox_state)
-
-        if self.dolphintool_wia_compression_combo_box:
-            self.dolphintool_wia_compression_combo_box.clear()
-            items = {"No compression": "none", "Purge": "purge", "bzip2 (slow)": "bzip2", "LZMA (slow)": "lzma", "LZMA2 (slow)": "lzma2"}
-            for text, data in items.items(): self.dolphintool_wia_compression_combo_box.addItem(text, userData=data)
-            self.dolphintool_wia_compression_combo_box.currentTextChanged.connect(self._update_dolphintool_wia_level_spinbox_state)
-            
-        if self.dolphintool_gcz_blocksize_combo_box:
-            self.dolphintool_gcz_blocksize_combo_box.clear()
-            items = {"32 KiB": 32768, "64 KiB": 65536, "128 KiB": 131072, "256 KiB": 262144}
-            for text, data in items.items(): self.dolphintool_gcz_blocksize_combo_box.addItem(text, userData=data)
+        self.dolphintool_rvz_blocksize_combo_box.clear()
+        for text, data in DOLPHINTOOL_RVZ_BLOCKSIZE_ITEMS: self.dolphintool_rvz_blocksize_combo_box.addItem(text, userData=data)
+        self.dolphintool_rvz_compression_combo_box.clear()
+        for text, data in DOLPHINTOOL_RVZ_COMPRESSION_ITEMS: self.dolphintool_rvz_compression_combo_box.addItem(text, userData=data)
+        self.dolphintool_rvz_compression_combo_box.currentTextChanged.connect(self._update_dolphintool_rvz_level_spinbox_state)
+
+        self.dolphintool_wia_compression_combo_box.clear()
+        for text, data in DOLPHINTOOL_WIA_COMPRESSION_ITEMS: self.dolphintool_wia_compression_combo_box.addItem(text, userData=data)
+        self.dolphintool_wia_compression_combo_box.currentTextChanged.connect(self._update_dolphintool_wia_level_spinbox_state)
+
+        self.dolphintool_gcz_blocksize_combo_box.clear()
+        for text, data in DOLPHINTOOL_GCZ_BLOCKSIZE_ITEMS: self.dolphintool_gcz_blocksize_combo_box.addItem(text, userData=data)
 
     def _setup_chdman_options_group(self, hunk_cb, hunk_le, hunk_default_str, comp_cb, comp_le, comp_default_str):
-        if hunk_cb and hunk_le:
-            self._connect_checkbox_to_lineedit_enable(hunk_cb, [hunk_le], default_text=hunk_default_str, uncheck_clears=False)
-            if not hunk_cb.isChecked(): hunk_le.setText(hunk_default_str)
-        if comp_cb and comp_le:
-            self._connect_checkbox_to_lineedit_enable(comp_cb, [comp_le], default_text=comp_default_str, uncheck_clears=False)
-            if not comp_cb.isChecked(): comp_le.setText(comp_default_str)
+        self._connect_checkbox_to_lineedit_enable(hunk_cb, [hunk_le], default_text=hunk_default_str, uncheck_clears=False)
+        if not hunk_cb.isChecked(): hunk_le.setText(hunk_default_str)
+        self._connect_checkbox_to_lineedit_enable(comp_cb, [comp_le], default_text=comp_default_str, uncheck_clears=False)
+        if not comp_cb.isChecked(): comp_le.setText(comp_default_str)
 
     def _connect_checkbox_to_lineedit_enable(self, checkbox, lineedits, default_text=None, uncheck_clears=True):
-        if not checkbox: return
-        valid_lineedits = [le for le in lineedits if le is not None]
-
-        def toggle_lineedit_state(checked):
-            for le in valid_lineedits:
-                le.setEnabled(checked)
-                if not checked: 
-                    if default_text is not None:
-                        le.setText(default_text) 
-                    elif uncheck_clears: 
-                        le.clear()
-                elif checked and not le.text() and default_text is not None:
-                     le.setText(default_text)
-        
-        checkbox.toggled.connect(toggle_lineedit_state)
-        toggle_lineedit_state(checkbox.isChecked())
+        # Every guarded check box shares one slot, which finds its line edits here via sender().
+        self._checkbox_lineedit_links[checkbox] = (tuple(lineedits), default_text, uncheck_clears)
+        checkbox.toggled.connect(self._on_guarded_checkbox_toggled)
+        self._toggle_lineedit_state(checkbox, checkbox.isChecked())
+
+    def _on_guarded_checkbox_toggled(self, checked):
+        self._toggle_lineedit_state(self.sender(), checked)
+
+    def _toggle_lineedit_state(self, checkbox, checked):
+        lineedits, default_text, uncheck_clears = self._checkbox_lineedit_links[checkbox]
+        for le in lineedits:
+            le.setEnabled(checked)
+            if not checked: 
+                if default_text is not None:
+                    le.setText(default_text) 
+                elif uncheck_clears: 
+                    le.clear()
+            elif checked and not le.text() and default_text is not None:
+                 le.setText(default_text)
 
     def _update_dolphintool_rvz_level_spinbox_state(self, compression_text_not_used): 
-        if not self.dolphintool_rvz_level_spin_box or not self.dolphintool_rvz_compression_combo_box: return
         selected_compression_data = self.dolphintool_rvz_compression_combo_box.currentData() 
 
         current_value = self.dolphintool_rvz_level_spin_box.value()
@@ -229,7 +318,6 @@ class SettingsDialog(QDialog):
             self.dolphintool_rvz_level_spin_box.setEnabled(False)
 
     def _update_dolphintool_wia_level_spinbox_state(self, compression_text_not_used):
-        if not self.dolphintool_wia_level_spin_box or not self.dolphintool_wia_compression_combo_box: return
         selected_compression_data = self.dolphintool_wia_compression_combo_box.currentData()
         
         current_value = self.dolphintool_wia_level_spin_box.value()
@@ -246,12 +334,14 @@ class SettingsDialog(QDialog):
             self.dolphintool_wia_level_spin_box.setEnabled(False)
 
     def _connect_signals(self):
-        if self.temp_dir_browse_button:
-            self.temp_dir_browse_button.clicked.connect(self.browse_temp_dir)
-        if self.button_box:
-            self.button_box.accepted.connect(self.accept) 
-            self.button_box.rejected.connect(self.reject) 
-        
+        self.temp_dir_browse_button.clicked.connect(self.browse_temp_dir)
+        self.button_box.accepted.connect(self.accept) 
+        self.button_box.rejected.connect(self.reject) 
+
+        self._apply_dependent_widget_states()
+
+    def _apply_dependent_widget_states(self):
+        """Re-runs the checkbox and compression handlers so dependent fields match the loaded values."""
         checkboxes_to_emit = [
             self.chdman_cd_hunksize_check_box, self.chdman_cd_compression_check_box,
             self.chdman_dvd_hunksize_check_box, self.chdman_dvd_compression_check_box,
@@ -262,13 +352,16 @@ class SettingsDialog(QDialog):
             self.chdman_harddisk_chs_check_box, self.chdman_harddisk_template_check_box,
             self.chdman_raw_hunksize_check_box, self.chdman_raw_compression_check_box
         ]
-        for cb in checkboxes_to_emit:
-            if cb: cb.toggled.emit(cb.isChecked()) 
+        # Each handler may touch several widgets; suspending updates repaints the dialog once at the end.
+        self.ui_container.setUpdatesEnabled(False)
+        try:
+            for cb in checkboxes_to_emit:
+                cb.toggled.emit(cb.isChecked()) 
 
-        if self.dolphintool_rvz_compression_combo_box:
             self.dolphintool_rvz_compression_combo_box.currentTextChanged.emit(self.dolphintool_rvz_compression_combo_box.currentText())
-        if self.dolphintool_wia_compression_combo_box:
             self.dolphintool_wia_compression_combo_box.currentTextChanged.emit(self.dolphintool_wia_compression_combo_box.currentText())
+        finally:
+            self.ui_container.setUpdatesEnabled(True)
 
     def setup_fallback_ui(self): 
         self.setWindowTitle("Settings Error")
@@ -283,83 +376,49 @@ class SettingsDialog(QDialog):
         self.setLayout(layout)
 
     def _set_combobox_by_data(self, combobox, data_to_find):
-        if not combobox: return
         for i in range(combobox.count()):
             if combobox.itemData(i) == data_to_find:
                 combobox.setCurrentIndex(i)
                 return
         if combobox.count() > 0: combobox.setCurrentIndex(0) 
 
+    def load_from_config(self):
+        """Refreshes a reused dialog from config.settings, discarding edits from a cancelled session."""
+        if not getattr(self, "ui_container", None):
+            return  # Fallback UI has no settings widgets
+        self.load_settings_to_ui()
+        self._apply_dependent_widget_states()
+
     def load_settings_to_ui(self):
-        if self.copy_locally_checkbox: self.copy_locally_checkbox.setChecked(config.settings.COPY_LOCALLY)
-        if self.temp_dir_edit: self.temp_dir_edit.setText(config.settings.MAIN_TEMP_DIR)
-
-        if self.chdman_threaded_processors_combo_box:
-            if config.settings.CHDMAN_NUM_PROCESSORS_MODE == "auto":
-                self._set_combobox_by_data(self.chdman_threaded_processors_combo_box, "auto")
-            else: 
-                self._set_combobox_by_data(self.chdman_threaded_processors_combo_box, config.settings.CHDMAN_NUM_PROCESSORS_MANUAL)
-        
-        if self.chdman_cd_hunksize_check_box: self.chdman_cd_hunksize_check_box.setChecked(config.settings.CHDMAN_CD_USE_CUSTOM_HUNKS)
-        if self.chdman_cd_hunksize_line_edit: self.chdman_cd_hunksize_line_edit.setText(str(config.settings.CHDMAN_CD_HUNKS))
-        if self.chdman_cd_compression_check_box: self.chdman_cd_compression_check_box.setChecked(config.settings.CHDMAN_CD_USE_CUSTOM_COMPRESSION)
-        if self.chdman_cd_compression_line_edit: self.chdman_cd_compression_line_edit.setText(config.settings.CHDMAN_CD_COMPRESSION_TYPES)
-        
-        if self.chdman_dvd_hunksize_check_box: self.chdman_dvd_hunksize_check_box.setChecked(config.settings.CHDMAN_DVD_USE_CUSTOM_HUNKS)
-        if self.chdman_dvd_hunksize_line_edit: self.chdman_dvd_hunksize_line_edit.setText(str(config.settings.CHDMAN_DVD_HUNKS))
-        if self.chdman_dvd_compression_check_box: self.chdman_dvd_compression_check_box.setChecked(config.settings.CHDMAN_DVD_USE_CUSTOM_COMPRESSION)
-        if self.chdman_dvd_compression_line_edit: self.chdman_dvd_compression_line_edit.setText(config.settings.CHDMAN_DVD_COMPRESSION_TYPES)
-
-        if self.chdman_laserdisc_hunksize_check_box: self.chdman_laserdisc_hunksize_check_box.setChecked(config.settings.CHDMAN_LD_USE_CUSTOM_HUNKS)
-        if self.chdman_laserdisc_hunksize_line_edit: self.chdman_laserdisc_hunksize_line_edit.setText(str(config.settings.CHDMAN_LD_HUNKS))
-        if self.chdman_laserdisc_compression_check_box: self.chdman_laserdisc_compression_check_box.setChecked(config.settings.CHDMAN_LD_USE_CUSTOM_COMPRESSION)
-        if self.chdman_laserdisc_compression_line_edit: self.chdman_laserdisc_compression_line_edit.setText(config.settings.CHDMAN_LD_COMPRESSION_TYPES)
-        if self.chdman_laserdisc_startframe_check_box: self.chdman_laserdisc_startframe_check_box.setChecked(config.settings.CHDMAN_LD_USE_INPUT_START_FRAME)
-        if self.chdman_laserdisc_startframe_line_edit: self.chdman_laserdisc_startframe_line_edit.setText(str(config.settings.CHDMAN_LD_INPUT_START_FRAME or ""))
-        if self.chdman_laserdisc_inputframes_check_box: self.chdman_laserdisc_inputframes_check_box.setChecked(config.settings.CHDMAN_LD_USE_INPUT_FRAMES)
-        if self.chdman_laserdisc_inputframes_line_edit: self.chdman_laserdisc_inputframes_line_edit.setText(str(config.settings.CHDMAN_LD_INPUT_FRAMES or ""))
-
-        if self.chdman_harddisk_hunksize_check_box: self.chdman_harddisk_hunksize_check_box.setChecked(config.settings.CHDMAN_HD_USE_CUSTOM_HUNKS)
-        if self.chdman_harddisk_hunksize_line_edit: self.chdman_harddisk_hunksize_line_edit.setText(str(config.settings.CHDMAN_HD_HUNKS))
-        if self.chdman_harddisk_compression_check_box: self.chdman_harddisk_compression_check_box.setChecked(config.settings.CHDMAN_HD_USE_CUSTOM_COMPRESSION)
-        if self.chdman_harddisk_compression_line_edit: self.chdman_harddisk_compression_line_edit.setText(config.settings.CHDMAN_HD_COMPRESSION_TYPES)
-        if self.chdman_harddisk_sector_check_box: self.chdman_harddisk_sector_check_box.setChecked(config.settings.CHDMAN_HD_USE_SECTOR_SIZE)
-        if self.chdman_harddisk_sector_line_edit: self.chdman_harddisk_sector_line_edit.setText(str(config.settings.CHDMAN_HD_SECTOR_SIZE or ""))
-        if self.chdman_harddisk_size_check_box: self.chdman_harddisk_size_check_box.setChecked(config.settings.CHDMAN_HD_USE_SIZE)
-        if self.chdman_harddisk_size_line_edit: self.chdman_harddisk_size_line_edit.setText(str(config.settings.CHDMAN_HD_SIZE or ""))
-        if self.chdman_harddisk_chs_check_box: self.chdman_harddisk_chs_check_box.setChecked(config.settings.CHDMAN_HD_USE_CHS)
-        if self.chdman_harddisk_chs_c_line_edit: self.chdman_harddisk_chs_c_line_edit.setText(str(config.settings.CHDMAN_HD_CHS_C or ""))
-        if self.chdman_harddisk_chs_h_line_edit: self.chdman_harddisk_chs_h_line_edit.setText(str(config.settings.CHDMAN_HD_CHS_H or ""))
-        if self.chdman_harddisk_chs_s_line_edit: self.chdman_harddisk_chs_s_line_edit.setText(str(config.settings.CHDMAN_HD_CHS_S or ""))
-        if self.chdman_harddisk_template_check_box: self.chdman_harddisk_template_check_box.setChecked(config.settings.CHDMAN_HD_USE_TEMPLATE)
-        if self.chdman_harddisk_template_line_edit: self.chdman_harddisk_template_line_edit.setText(config.settings.CHDMAN_HD_TEMPLATE_PATH or "")
-
-        if self.chdman_raw_hunksize_check_box: self.chdman_raw_hunksize_check_box.setChecked(config.settings.CHDMAN_RAW_USE_CUSTOM_HUNKS)
-        if self.chdman_raw_hunksize_line_edit: self.chdman_raw_hunksize_line_edit.setText(str(config.settings.CHDMAN_RAW_HUNKS))
-        if self.chdman_raw_compression_check_box: self.chdman_raw_compression_check_box.setChecked(config.settings.CHDMAN_RAW_USE_CUSTOM_COMPRESSION)
-        if self.chdman_raw_compression_line_edit: self.chdman_raw_compression_line_edit.setText(config.settings.CHDMAN_RAW_COMPRESSION_TYPES)
-
-        if self.chdman_verify_fix_checkbox: self.chdman_verify_fix_checkbox.setChecked(config.settings.CHDMAN_VERIFY_FIX)
-
-        if self.dolphintool_rvz_blocksize_combo_box: self._set_combobox_by_data(self.dolphintool_rvz_blocksize_combo_box, config.settings.DOLPHINTOOL_RVZ_BLOCKSIZE)
-        if self.dolphintool_rvz_compression_combo_box: self._set_combobox_by_data(self.dolphintool_rvz_compression_combo_box, config.settings.DOLPHINTOOL_RVZ_COMPRESSION_TYPE)
-        if self.dolphintool_rvz_level_spin_box: self.dolphintool_rvz_level_spin_box.setValue(config.settings.DOLPHINTOOL_RVZ_COMPRESSION_LEVEL)
-        
-        if self.dolphintool_wia_compression_combo_box: self._set_combobox_by_data(self.dolphintool_wia_compression_combo_box, config.settings.DOLPHINTOOL_WIA_COMPRESSION_TYPE)
-        if self.dolphintool_wia_level_spin_box: self.dolphintool_wia_level_spin_box.setValue(config.settings.DOLPHINTOOL_WIA_COMPRESSION_LEVEL)
+        self.copy_locally_checkbox.setChecked(config.settings.COPY_LOCALLY)
+        self.temp_dir_edit.setText(config.settings.MAIN_TEMP_DIR)
 
-        if self.dolphintool_gcz_blocksize_combo_box: self._set_combobox_by_data(self.dolphintool_gcz_blocksize_combo_box, config.settings.DOLPHINTOOL_GCZ_BLOCKSIZE)
+        if config.settings.CHDMAN_NUM_PROCESSORS_MODE == "auto":
+            self._set_combobox_by_data(self.chdman_threaded_processors_combo_box, "auto")
+        else: 
+            self._set_combobox_by_data(self.chdman_threaded_processors_combo_box, config.settings.CHDMAN_NUM_PROCESSORS_MANUAL)
+        
+        for attr, key, kind in SETTINGS_WIDGET_BINDINGS:
+            widget = getattr(self, attr)
+            value = getattr(config.settings, key)
+            if kind == "check":
+                widget.setChecked(value)
+            elif kind == "combo":
+                self._set_combobox_by_data(widget, value)
+            elif kind == "spin":
+                widget.setValue(value)
+            else:
+                text = str(value or "") if kind.startswith("optional_") else str(value)
+                if widget.text() != text:
+                    widget.setText(text)
 
     def browse_temp_dir(self):
-        if not self.temp_dir_edit: return
         current_path = self.temp_dir_edit.text() or config.get_default_temp_dir() # get_default_temp_dir is fine
         directory = QFileDialog.getExistingDirectory(self, "Select Temporary Directory", current_path)
         if directory:
             self.temp_dir_edit.setText(os.path.normpath(directory))
 
     def _get_int_from_lineedit(self, lineedit, default_if_empty=None, allow_none_if_empty_and_default_is_none=False):
-        if not lineedit: 
-            return default_if_empty
         text = lineedit.text().strip()
         if not text:
             return None if allow_none_if_empty_and_default_is_none and default_if_empty is None else default_if_empty
@@ -369,85 +428,53 @@ class SettingsDialog(QDialog):
             return default_if_empty
 
     def _get_str_from_lineedit(self, lineedit, default_if_empty=None, allow_none_if_empty_and_default_is_none=False):
-        if not lineedit: return default_if_empty
         text = lineedit.text().strip()
         if not text:
             return None if allow_none_if_empty_and_default_is_none and default_if_empty is None else default_if_empty
         return text
 
     def accept(self):
-        if self.copy_locally_checkbox: config.settings.COPY_LOCALLY = self.copy_locally_checkbox.isChecked()
-        if self.temp_dir_edit:
-            temp_dir_text = self.temp_dir_edit.text().strip()
-            config.settings.MAIN_TEMP_DIR = temp_dir_text if temp_dir_text else config.get_default_temp_dir()
-            # Validation for MAIN_TEMP_DIR path
-            if not os.path.exists(config.settings.MAIN_TEMP_DIR):
-                parent_dir = os.path.dirname(config.settings.MAIN_TEMP_DIR)
-                if not parent_dir or not os.path.isdir(parent_dir): 
-                    QMessageBox.warning(self, "Settings Error", f"Parent directory for Temp Directory does not exist or is invalid: {parent_dir}")
-                    return 
-            elif not os.path.isdir(config.settings.MAIN_TEMP_DIR):
-                 QMessageBox.warning(self, "Settings Error", f"Temp Directory path exists but is not a directory: {config.settings.MAIN_TEMP_DIR}")
-                 return
-
-        if self.chdman_threaded_processors_combo_box:
-            selected_proc_data = self.chdman_threaded_processors_combo_box.currentData()
-            if selected_proc_data == "auto":
-                config.settings.CHDMAN_NUM_PROCESSORS_MODE = "auto"
-                config.settings.CHDMAN_NUM_PROCESSORS_MANUAL = config.DEFAULT_SETTINGS["CHDMAN_NUM_PROCESSORS_MANUAL"]
-            else: 
-                config.settings.CHDMAN_NUM_PROCESSORS_MODE = "manual"
-                config.settings.CHDMAN_NUM_PROCESSORS_MANUAL = int(selected_proc_data)
-        
-        if self.chdman_cd_hunksize_check_box: config.settings.CHDMAN_CD_USE_CUSTOM_HUNKS = self.chdman_cd_hunksize_check_box.isChecked()
-        config.settings.CHDMAN_CD_HUNKS = self._get_int_from_lineedit(self.chdman_cd_hunksize_line_edit, config.DEFAULT_SETTINGS["CHDMAN_CD_HUNKS"])
-        if self.chdman_cd_compression_check_box: config.settings.CHDMAN_CD_USE_CUSTOM_COMPRESSION = self.chdman_cd_compression_check_box.isChecked()
-        config.settings.CHDMAN_CD_COMPRESSION_TYPES = self._get_str_from_lineedit(self.chdman_cd_compression_line_edit, config.DEFAULT_SETTINGS["CHDMAN_CD_COMPRESSION_TYPES"])
-
-        if self.chdman_dvd_hunksize_check_box: config.settings.CHDMAN_DVD_USE_CUSTOM_HUNKS = self.chdman_dvd_hunksize_check_box.isChecked()
-        config.settings.CHDMAN_DVD_HUNKS = self._get_int_from_lineedit(self.chdman_dvd_hunksize_line_edit, config.DEFAULT_SETTINGS["CHDMAN_DVD_HUNKS"])
-        if self.chdman_dvd_compression_check_box: config.settings.CHDMAN_DVD_USE_CUSTOM_COMPRESSION = self.chdman_dvd_compression_check_box.isChecked()
-        config.settings.CHDMAN_DVD_COMPRESSION_TYPES = self._get_str_from_lineedit(self.chdman_dvd_compression_line_edit, config.DEFAULT_SETTINGS["CHDMAN_DVD_COMPRESSION_TYPES"])
-
-        if self.chdman_laserdisc_hunksize_check_box: config.settings.CHDMAN_LD_USE_CUSTOM_HUNKS = self.chdman_laserdisc_hunksize_check_box.isChecked()
-        config.settings.CHDMAN_LD_HUNKS = self._get_int_from_lineedit(self.chdman_laserdisc_hunksize_line_edit, config.DEFAULT_SETTINGS["CHDMAN_LD_HUNKS"])
-        if self.chdman_laserdisc_compression_check_box: config.settings.CHDMAN_LD_USE_CUSTOM_COMPRESSION = self.chdman_laserdisc_compression_check_box.isChecked()
-        config.settings.CHDMAN_LD_COMPRESSION_TYPES = self._get_str_from_lineedit(self.chdman_laserdisc_compression_line_edit, config.DEFAULT_SETTINGS["CHDMAN_LD_COMPRESSION_TYPES"])
-        if self.chdman_laserdisc_startframe_check_box: config.settings.CHDMAN_LD_USE_INPUT_START_FRAME = self.chdman_laserdisc_startframe_check_box.isChecked()
-        config.settings.CHDMAN_LD_INPUT_START_FRAME = self._get_int_from_lineedit(self.chdman_laserdisc_startframe_line_edit, default_if_empty=None, allow_none_if_empty_and_default_is_none=True)
-        if self.chdman_laserdisc_inputframes_check_box: config.settings.CHDMAN_LD_USE_INPUT_FRAMES = self.chdman_laserdisc_inputframes_check_box.isChecked()
-        config.settings.CHDMAN_LD_INPUT_FRAMES = self._get_int_from_lineedit(self.chdman_laserdisc_inputframes_line_edit, default_if_empty=None, allow_none_if_empty_and_default_is_none=True)
-
-        if self.chdman_harddisk_hunksize_check_box: config.settings.CHDMAN_HD_USE_CUSTOM_HUNKS = self.chdman_harddisk_hunksize_check_box.isChecked()
-        config.settings.CHDMAN_HD_HUNKS = self._get_int_from_lineedit(self.chdman_harddisk_hunksize_line_edit, config.DEFAULT_SETTINGS["CHDMAN_HD_HUNKS"])
-        if self.chdman_harddisk_compression_check_box: config.settings.CHDMAN_HD_USE_CUSTOM_COMPRESSION = self.chdman_harddisk_compression_check_box.isChecked()
-        config.settings.CHDMAN_HD_COMPRESSION_TYPES = self._get_str_from_lineedit(self.chdman_harddisk_compression_line_edit, config.DEFAULT_SETTINGS["CHDMAN_HD_COMPRESSION_TYPES"])
-        if self.chdman_harddisk_sector_check_box: config.settings.CHDMAN_HD_USE_SECTOR_SIZE = self.chdman_harddisk_sector_check_box.isChecked()
-        config.settings.CHDMAN_HD_SECTOR_SIZE = self._get_int_from_lineedit(self.chdman_harddisk_sector_line_edit, default_if_empty=None, allow_none_if_empty_and_default_is_none=True)
-        if self.chdman_harddisk_size_check_box: config.settings.CHDMAN_HD_USE_SIZE = self.chdman_harddisk_size_check_box.isChecked()
-        config.settings.CHDMAN_HD_SIZE = self._get_str_from_lineedit(self.chdman_harddisk_size_line_edit, default_if_empty=None, allow_none_if_empty_and_default_is_none=True)
-        if self.chdman_harddisk_chs_check_box: config.settings.CHDMAN_HD_USE_CHS = self.chdman_harddisk_chs_check_box.isChecked()
-        config.settings.CHDMAN_HD_CHS_C = self._get_int_from_lineedit(self.chdman_harddisk_chs_c_line_edit, default_if_empty=None, allow_none_if_empty_and_default_is_none=True)
-        config.settings.CHDMAN_HD_CHS_H = self._get_int_from_lineedit(self.chdman_harddisk_chs_h_line_edit, default_if_empty=None, allow_none_if_empty_and_default_is_none=True)
-        config.settings.CHDMAN_HD_CHS_S = self._get_int_from_lineedit(self.chdman_harddisk_chs_s_line_edit, default_if_empty=None, allow_none_if_empty_and_default_is_none=True)
-        if self.chdman_harddisk_template_check_box: config.settings.CHDMAN_HD_USE_TEMPLATE = self.chdman_harddisk_template_check_box.isChecked()
-        config.settings.CHDMAN_HD_TEMPLATE_PATH = self._get_str_from_lineedit(self.chdman_harddisk_template_line_edit, default_if_empty=None, allow_none_if_empty_and_default_is_none=True)
-
-        if self.chdman_raw_hunksize_check_box: config.settings.CHDMAN_RAW_USE_CUSTOM_HUNKS = self.chdman_raw_hunksize_check_box.isChecked()
-        config.settings.CHDMAN_RAW_HUNKS = self._get_int_from_lineedit(self.chdman_raw_hunksize_line_edit, config.DEFAULT_SETTINGS["CHDMAN_RAW_HUNKS"])
-        if self.chdman_raw_compression_check_box: config.settings.CHDMAN_RAW_USE_CUSTOM_COMPRESSION = self.chdman_raw_compression_check_box.isChecked()
-        config.settings.CHDMAN_RAW_COMPRESSION_TYPES = self._get_str_from_lineedit(self.chdman_raw_compression_line_edit, config.DEFAULT_SETTINGS["CHDMAN_RAW_COMPRESSION_TYPES"])
-
-        if self.chdman_verify_fix_checkbox: config.settings.CHDMAN_VERIFY_FIX = self.chdman_verify_fix_checkbox.isChecked()
-        
-        if self.dolphintool_rvz_blocksize_combo_box: config.settings.DOLPHINTOOL_RVZ_BLOCKSIZE = self.dolphintool_rvz_blocksize_combo_box.currentData()
-        if self.dolphintool_rvz_compression_combo_box: config.settings.DOLPHINTOOL_RVZ_COMPRESSION_TYPE = self.dolphintool_rvz_compression_combo_box.currentData()
-        if self.dolphintool_rvz_level_spin_box: config.settings.DOLPHINTOOL_RVZ_COMPRESSION_LEVEL = self.dolphintool_rvz_level_spin_box.value()
-        
-        if self.dolphintool_wia_compression_combo_box: config.settings.DOLPHINTOOL_WIA_COMPRESSION_TYPE = self.dolphintool_wia_compression_combo_box.currentData()
-        if self.dolphintool_wia_level_spin_box: config.settings.DOLPHINTOOL_WIA_COMPRESSION_LEVEL = self.dolphintool_wia_level_spin_box.value()
+        config.settings.COPY_LOCALLY = self.copy_locally_checkbox.isChecked()
+        temp_dir_text = self.temp_dir_edit.text().strip()
+        config.settings.MAIN_TEMP_DIR = temp_dir_text if temp_dir_text else config.get_default_temp_dir()
+        # Validation for MAIN_TEMP_DIR path; one stat answers both "exists" and "is a directory".
+        try:
+            temp_dir_mode = os.stat(config.settings.MAIN_TEMP_DIR).st_mode
+        except OSError:
+            parent_dir = os.path.dirname(config.settings.MAIN_TEMP_DIR)
+            if not parent_dir or not os.path.isdir(parent_dir): 
+                QMessageBox.warning(self, "Settings Error", f"Parent directory for Temp Directory does not exist or is invalid: {parent_dir}")
+                return 
+        else:
+            if not stat.S_ISDIR(temp_dir_mode):
+                QMessageBox.warning(self, "Settings Error", f"Temp Directory path exists but is not a directory: {config.settings.MAIN_TEMP_DIR}")
+                return
 
-        if self.dolphintool_gcz_blocksize_combo_box: config.settings.DOLPHINTOOL_GCZ_BLOCKSIZE = self.dolphintool_gcz_blocksize_combo_box.currentData()
+        selected_proc_data = self.chdman_threaded_processors_combo_box.currentData()
+        if selected_proc_data == "auto":
+            config.settings.CHDMAN_NUM_PROCESSORS_MODE = "auto"
+            config.settings.CHDMAN_NUM_PROCESSORS_MANUAL = config.DEFAULT_SETTINGS["CHDMAN_NUM_PROCESSORS_MANUAL"]
+        else: 
+            config.settings.CHDMAN_NUM_PROCESSORS_MODE = "manual"
+            config.settings.CHDMAN_NUM_PROCESSORS_MANUAL = int(selected_proc_data)
+        
+        for attr, key, kind in SETTINGS_WIDGET_BINDINGS:
+            widget = getattr(self, attr)
+            if kind == "int_text":
+                value = self._get_int_from_lineedit(widget, config.DEFAULT_SETTINGS[key])
+            elif kind == "str_text":
+                value = self._get_str_from_lineedit(widget, config.DEFAULT_SETTINGS[key])
+            elif kind == "optional_int_text":
+                value = self._get_int_from_lineedit(widget, default_if_empty=None, allow_none_if_empty_and_default_is_none=True)
+            elif kind == "optional_str_text":
+                value = self._get_str_from_lineedit(widget, default_if_empty=None, allow_none_if_empty_and_default_is_none=True)
+            elif kind == "check":
+                value = widget.isChecked()
+            elif kind == "combo":
+                value = widget.currentData()
+            else:
+                value = widget.value()
+            setattr(config.settings, key, value)
         
         config.save_app_settings() # This now calls config.settings.save()
         
@@ -3,11 +3,12 @@
 import os
 import traceback
 try:
-    from PySide6.QtCore import QThread, Signal
+    from PySide6.QtCore import QThread, Signal, QObject, QRunnable
 except ImportError as e:
     print(f"FATAL ERROR (gui_worker.py): PySide6.QtCore not found. {e}")
     raise
 
+import config
 import utils
 import conversions
 
@@ -19,7 +20,6 @@ class ConversionWorker(QThread):
     output_update = Signal(str)
     error_update = Signal(str)
     critical_error_occurred = Signal(str)
-    file_progress_update = Signal(int) # Percentage for the current file (0-100)
     finished = Signal(int, int)  # success_count, fail_count
 
     def __init__(self, files_to_convert, conversion_details, output_folder_path,
@@ -50,10 +50,20 @@ class ConversionWorker(QThread):
             f"{stage_description}: {current_filename}" 
         )
 
+    def _report_file_completed(self, file_index, stage_description, current_filename):
+        # Jumps straight to the file's last stage with one status update instead of one per skipped stage.
+        expected_steps_for_this_file = (file_index + 1) * N_STAGES_PER_FILE
+        if self._stop_requested or self.cumulative_overall_steps >= expected_steps_for_this_file:
+            return
+        self.cumulative_overall_steps = expected_steps_for_this_file - 1
+        self._report_stage_progress(stage_description, current_filename)
+
     def run(self):
         self._stop_requested = False 
+        utils.stop_event.clear()
         success_count = 0
         fail_count = 0
+        cancelled_count = 0  # Files interrupted or skipped by a stop request; not failures
         
         func_name = self.conversion_details.get('conversion_func_name')
         conv_func = getattr(conversions, func_name, None) if func_name else None
@@ -67,6 +77,9 @@ class ConversionWorker(QThread):
 
         primary_out_ext_for_util = self.selected_primary_output_ext
         secondary_out_ext_for_util = self.selected_secondary_output_ext
+        # Fixed for the whole job, so resolved once rather than per file.
+        total_files = len(self.files_to_convert)
+        current_output_dir = self.output_folder_path
 
         self.cumulative_overall_steps = 0 
 
@@ -74,16 +87,13 @@ class ConversionWorker(QThread):
             for i, file_path in enumerate(self.files_to_convert):
                 if self._stop_requested:
                     self.output_update.emit("--- Conversion process aborted by user ---")
-                    fail_count = len(self.files_to_convert) - success_count 
+                    cancelled_count += total_files - i
                     break 
 
                 current_file_name = os.path.basename(file_path)
-                self.output_update.emit(f"\n--- Processing file {i+1}/{len(self.files_to_convert)}: {current_file_name} ---")
-                self.file_progress_update.emit(0) 
+                self.output_update.emit(f"\n--- Processing file {i+1}/{total_files}: {current_file_name} ---")
 
                 stage_reporter_for_process_file = lambda stage_desc: self._report_stage_progress(stage_desc, current_file_name)
-                
-                current_output_dir = self.output_folder_path 
 
                 success = utils.process_file(
                     file_path,
@@ -100,44 +110,90 @@ class ConversionWorker(QThread):
 
                 if self._stop_requested: 
                     self.output_update.emit(f"--- Processing of {current_file_name} interrupted by stop request ---")
-                    fail_count += 1 
-                    expected_steps_for_this_file_so_far = (i + 1) * N_STAGES_PER_FILE
-                    if self.cumulative_overall_steps < expected_steps_for_this_file_so_far:
-                        missing_stages = expected_steps_for_this_file_so_far - self.cumulative_overall_steps
-                        for _ in range(missing_stages):
-                            self._report_stage_progress("Interrupted", current_file_name)
+                    cancelled_count += 1 
+                    self._report_file_completed(i, "Interrupted", current_file_name)
                     continue 
 
                 if success:
                     success_count += 1
                     self.output_update.emit(f"--- Success: {current_file_name} ---")
-                    self.file_progress_update.emit(100) 
                 else:
                     fail_count += 1
                     self.error_update.emit(f"--- FAILED: {current_file_name} (check log for details) ---")
-                    expected_steps_for_this_file = (i + 1) * N_STAGES_PER_FILE
-                    if self.cumulative_overall_steps < expected_steps_for_this_file:
-                        missing_stages = expected_steps_for_this_file - self.cumulative_overall_steps
-                        for _ in range(missing_stages): 
-                            self._report_stage_progress("File failed", current_file_name)
-                    self.file_progress_update.emit(100) 
+                    self._report_file_completed(i, "File failed", current_file_name)
         
         except Exception as e:
-            tb = traceback.format_exc()
-            critical_msg = f"Critical Error in conversion worker thread: {e}\nTraceback:\n{tb}"
+            critical_msg = f"Critical Error in conversion worker thread: {type(e).__name__}: {e}"
+            if config.settings.DEBUG_MODE:
+                critical_msg += f"\nTraceback:\n{traceback.format_exc()}"
             self.error_update.emit(critical_msg)
             self.critical_error_occurred.emit(critical_msg) 
-            fail_count = len(self.files_to_convert) - success_count
+            fail_count = len(self.files_to_convert) - success_count - cancelled_count
         finally:
+            # stop_event is module-wide; leaving it set would cancel the next utils.run_command() caller.
+            utils.stop_event.clear()
+            if cancelled_count:
+                self.output_update.emit(f"--- {cancelled_count} file(s) not converted because of the stop request ---")
             if not self._stop_requested and self.cumulative_overall_steps < self.total_overall_steps:
                 final_stage_desc = "Job finalizing after error or incomplete run" if fail_count > 0 else "Finalizing job completion"
-                remaining_ticks = self.total_overall_steps - self.cumulative_overall_steps
-                for _ in range(remaining_ticks):
-                    self.cumulative_overall_steps += 1
-                    self.status_update.emit(self.cumulative_overall_steps, self.total_overall_steps, final_stage_desc)
+                self.cumulative_overall_steps = self.total_overall_steps
+                self.status_update.emit(self.cumulative_overall_steps, self.total_overall_steps, final_stage_desc)
 
             self.finished.emit(success_count, fail_count)
 
     def request_stop(self):
-        self.output_update.emit("--- Stop requested for current job ---")
+        # Flip the flag before anything else so the run loop sees it as early as possible.
         self._stop_requested = True
+        utils.stop_event.set()
+        self.output_update.emit("--- Stop requested for current job ---")
+
+
+def scan_folder(folder_path, recursive, valid_extensions, excluded_dir):
+    """
+    Returns the normalized paths of files under folder_path whose lowercase extension
+    (without the dot) is in valid_extensions; an empty valid_extensions matches every file.
+    Processing temp folders and anything under excluded_dir are skipped.
+    """
+    found = []
+    pending_dirs = [folder_path]
+    while pending_dirs:
+        current_dir = os.path.normpath(pending_dirs.pop())
+        if '_processing_temps_' in current_dir or current_dir.startswith(excluded_dir):
+            continue
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    # DirEntry caches the file type from the directory read, so no extra stat per file.
+                    if entry.is_file():
+                        stem, dot, ext = entry.name.rpartition('.')
+                        ext_lower = ext.lower() if dot and stem else ''
+                        if not valid_extensions or ext_lower in valid_extensions:
+                            found.append(os.path.normpath(entry.path))
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append(entry.path)
+        except OSError:
+            continue
+    return found
+
+
+class FolderScanSignals(QObject):
+    results_ready = Signal(list)  # matching file paths
+
+
+class FolderScanRunnable(QRunnable):
+    """Runs scan_folder on a thread pool thread so large trees do not block the GUI."""
+
+    def __init__(self, folder_path, recursive, valid_extensions, excluded_dir):
+        super().__init__()
+        self.signals = FolderScanSignals()
+        self.folder_path = folder_path
+        self.recursive = recursive
+        self.valid_extensions = frozenset(valid_extensions)
+        self.excluded_dir = excluded_dir
+
+    def run(self):
+        try:
+            found = scan_folder(self.folder_path, self.recursive, self.valid_extensions, self.excluded_dir)
+        except OSError:
+            found = []
+        self.signals.results_ready.emit(found)
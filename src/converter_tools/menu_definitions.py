@@ -176,6 +176,15 @@ JOB_DEFINITIONS = [
     },
 ]
 
+# --- Lookup tables built once at import for O(1) job/media selection ---
+JOB_DEFINITIONS_BY_NAME = {job["job_name"]: job for job in JOB_DEFINITIONS}
+for _job in JOB_DEFINITIONS:
+    _job["_media_by_name"] = {media["media_name"]: media for media in _job.get("media_types", [])}
+    for _media in _job.get("media_types", []):
+        # Normalized once so filtering never lowercases extensions per file.
+        _media["_input_ext_set"] = frozenset(
+            ext.lower().lstrip('.') for ext in _media.get("input_ext", []))
+
 
 # --- Helper function to get all possible input extensions from JOB_DEFINITIONS ---
 def get_all_job_input_extensions():
@@ -189,13 +198,12 @@ def get_all_job_input_extensions():
 
 
 ALL_VALID_INPUT_EXTENSIONS = get_all_job_input_extensions()
+ALL_VALID_INPUT_EXTENSIONS_SET = frozenset(ALL_VALID_INPUT_EXTENSIONS)
 
 
 def get_job_media_details(job_name_selected, media_name_selected):
     """Retrieves the details for a specific job and media type."""
-    for job in JOB_DEFINITIONS:
-        if job["job_name"] == job_name_selected:
-            for media_type in job["media_types"]:
-                if media_type["media_name"] == media_name_selected:
-                    return media_type
-    return None
+    job = JOB_DEFINITIONS_BY_NAME.get(job_name_selected)
+    if not job:
+        return None
+    return job["_media_by_name"].get(media_name_selected)
@@ -7,16 +7,27 @@ import shutil
 import glob
 import time
 import tempfile
+import threading
 import config
 import re
 
 try:
     import send2trash
+    _HAS_SEND2TRASH = True
 except ImportError:
     send2trash = None
+    _HAS_SEND2TRASH = False
 
 ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
 
+# Conversion function -> whether it accepts a 'target_format_from_worker' argument.
+_TARGET_FORMAT_ARG_CACHE = {}
+
+# Set by the GUI worker on a stop request; run_command() then kills the tool it is waiting on.
+stop_event = threading.Event()
+# How often (seconds) run_command() checks stop_event while a tool is running.
+_STOP_POLL_INTERVAL_S = 0.25
+
 
 def _emit_or_print(message, signal=None, fallback_color_code=None, is_error=False):
     """
@@ -94,9 +105,22 @@ def run_command(command, cwd=None, output_signal=None, error_signal=None, known_
                    output_signal, fallback_color_code="green")
 
     try:
-        result = subprocess.run(
-            command, cwd=cwd, capture_output=True, text=True, check=False, encoding='utf-8', errors='replace'
+        process = subprocess.Popen(
+            command, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            text=True, encoding='utf-8', errors='replace'
         )
+        while True:
+            try:
+                stdout, stderr = process.communicate(timeout=_STOP_POLL_INTERVAL_S)
+                break
+            except subprocess.TimeoutExpired:
+                if stop_event.is_set():
+                    process.kill()
+                    process.communicate()
+                    # A user stop is not a tool failure; the caller's stop flag decides how the file is counted.
+                    _emit_or_print("WARNING: Command cancelled by stop request.", error_signal, fallback_color_code="yellow")
+                    return False
+        result = subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
         stdout_clean = strip_ansi_codes(result.stdout.strip())
         if stdout_clean:
             log_msg = f"--- STDOUT ---\n{stdout_clean}\n--------------"
@@ -240,7 +264,7 @@ def move_files(src_dir, dest_dir_base, pattern, output_signal=None, error_signal
         return False
 
 
-def cleanup(temp_path, original_file_path=None, output_signal=None, error_signal=None):
+def cleanup(temp_path, original_file_path=None, output_signal=None, error_signal=None, source_dependencies=None):
     if temp_path and os.path.exists(temp_path):
         retries = 3
         while retries > 0:
@@ -265,16 +289,35 @@ def cleanup(temp_path, original_file_path=None, output_signal=None, error_signal
                 break
 
     if config.settings.DELETE_SOURCE_ON_SUCCESS and original_file_path and os.path.exists(original_file_path):
-        files_to_delete = [original_file_path]
+        # Insertion-ordered dict: the source file first, O(1) duplicate checks for its dependencies.
+        files_to_delete = dict.fromkeys([original_file_path])
         base_name, ext = os.path.splitext(original_file_path)
-        if ext.lower() == '.cue':
+        if source_dependencies is not None:
+            # Only files beside the sheet are deleted, never ones it references elsewhere (e.g. ../shared/track.bin).
+            # CUE sheets keep the glob's naming rule too, so a BIN shared by other CUEs in the folder survives.
+            sheet_dir = os.path.normcase(os.path.dirname(os.path.abspath(original_file_path)))
+            sheet_stem_lower = os.path.basename(base_name).lower()
+            is_cue = ext.lower() == '.cue'
+            for dep_path in source_dependencies:
+                if os.path.normcase(os.path.dirname(os.path.abspath(dep_path))) != sheet_dir:
+                    continue
+                dep_name_lower = os.path.basename(dep_path).lower()
+                if is_cue and not (dep_name_lower.startswith(sheet_stem_lower) and dep_name_lower.endswith(".bin")):
+                    continue
+                if dep_path not in files_to_delete and os.path.exists(dep_path):
+                    files_to_delete[dep_path] = None
+                    _emit_or_print(
+                        f">> Found associated file for deletion: \"{os.path.basename(dep_path)}\"", output_signal, fallback_color_code="green")
+        elif ext.lower() == '.cue':
             bin_pattern = f"{re.escape(base_name)}*.bin"
             cue_dir = os.path.dirname(original_file_path)
             associated_bins = glob.glob(os.path.join(cue_dir, bin_pattern))
+            base_name_lower = base_name.lower()
             for bin_file in associated_bins:
-                if os.path.exists(bin_file) and bin_file.lower().startswith(base_name.lower()) and bin_file.lower().endswith(".bin"):
+                bin_file_lower = bin_file.lower()
+                if os.path.exists(bin_file) and bin_file_lower.startswith(base_name_lower) and bin_file_lower.endswith(".bin"):
                     if bin_file not in files_to_delete:
-                        files_to_delete.append(bin_file)
+                        files_to_delete[bin_file] = None
                         _emit_or_print(
                             f">> Found associated file for deletion: \"{os.path.basename(bin_file)}\"", output_signal, fallback_color_code="green")
 
@@ -285,7 +328,7 @@ def cleanup(temp_path, original_file_path=None, output_signal=None, error_signal
             _emit_or_print(
                 f">> Attempting to send to Recycle Bin/Trash: \"{os.path.basename(file_to_delete_path)}\"", output_signal, fallback_color_code="green")
             deleted_successfully_to_recycle = False
-            if send2trash:
+            if _HAS_SEND2TRASH:
                 try:
                     send2trash.send2trash(file_to_delete_path)
                     _emit_or_print(
@@ -320,6 +363,17 @@ def cleanup(temp_path, original_file_path=None, output_signal=None, error_signal
                         f"ERROR: Failed to permanently delete source {file_to_delete_path}: {remove_e}", error_signal, is_error=True)
 
 
+def _accepts_target_format(conversion_func):
+    """Returns whether conversion_func takes 'target_format_from_worker', caching the answer per function."""
+    try:
+        return _TARGET_FORMAT_ARG_CACHE[conversion_func]
+    except KeyError:
+        code = getattr(conversion_func, '__code__', None)
+        accepts = code is not None and 'target_format_from_worker' in code.co_varnames
+        _TARGET_FORMAT_ARG_CACHE[conversion_func] = accepts
+        return accepts
+
+
 def extract_archive(archive_path, output_dir, output_signal=None, error_signal=None):
     _emit_or_print(f">> Extracting: \"{os.path.basename(archive_path)}\" to \"{output_dir}\"",
                    output_signal, fallback_color_code="green")
@@ -332,7 +386,18 @@ def process_file(file_path, conversion_func, format_out, format_out2=None,
                  target_format_from_worker=None, stage_reporter=None, file_progress_reporter=None):
     original_dir_of_input_file = os.path.dirname(file_path)
     file_name_base_with_ext = os.path.basename(file_path)
-    name_part, _ = os.path.splitext(file_name_base_with_ext)
+    name_part, file_ext_lower = os.path.splitext(file_name_base_with_ext)
+    file_ext_lower = file_ext_lower.lower()
+    pass_target_format = bool(target_format_from_worker) and _accepts_target_format(conversion_func)
+    # Read once so the whole file is processed against one consistent snapshot of the settings.
+    copy_locally = config.settings.COPY_LOCALLY
+    delete_source_on_success = config.settings.DELETE_SOURCE_ON_SUCCESS
+
+    # Parsed once here and reused for both the local copy and source deletion.
+    # None (not an empty list) when nothing was parsed, so cleanup() falls back to its .bin glob.
+    source_dependencies = None
+    if copy_locally or delete_source_on_success:
+        source_dependencies = _get_sheet_dependencies(file_path, file_ext_lower, error_signal) or None
 
     final_output_destination_base = explicit_output_dir if explicit_output_dir else original_dir_of_input_file
     if not os.path.exists(final_output_destination_base):
@@ -351,7 +416,7 @@ def process_file(file_path, conversion_func, format_out, format_out2=None,
         return False
 
     path_to_process_in_temp = file_path
-    if config.settings.COPY_LOCALLY:
+    if copy_locally:
         _emit_or_print(f">> Copying \"{file_name_base_with_ext}\" to \"{temp_path_for_this_file}\"",
                        output_signal, fallback_color_code="green")
         try:
@@ -364,17 +429,7 @@ def process_file(file_path, conversion_func, format_out, format_out2=None,
                 shutil.copy2(file_path, target_copy_path)
             path_to_process_in_temp = target_copy_path
 
-            # Check for .cue or .gdi files to copy dependencies
-            _, file_ext = os.path.splitext(file_path)
-            file_ext = file_ext.lower()
-
-            dependencies_to_copy = []
-            if file_ext == '.cue':
-                dependencies_to_copy = _get_cue_dependencies(file_path)
-            elif file_ext == '.gdi':
-                dependencies_to_copy = _get_gdi_dependencies(file_path)
-
-            for dep_path in dependencies_to_copy:
+            for dep_path in source_dependencies or ():
                 dep_filename = os.path.basename(dep_path)
                 temp_dep_dest_path = os.path.join(temp_path_for_this_file, dep_filename)
                 try:
@@ -413,7 +468,7 @@ def process_file(file_path, conversion_func, format_out, format_out2=None,
         "output_signal": output_signal,
         "error_signal": error_signal
     }
-    if target_format_from_worker and hasattr(conversion_func, '__code__') and 'target_format_from_worker' in conversion_func.__code__.co_varnames:
+    if pass_target_format:
         conversion_args["target_format_from_worker"] = target_format_from_worker
     conversion_successful = conversion_func(**conversion_args)
 
@@ -436,9 +491,7 @@ def process_file(file_path, conversion_func, format_out, format_out2=None,
         file_progress_reporter(66)  # Finalizing stage
     if conversion_successful:
         primary_move_ok = False
-        effective_format_out = target_format_from_worker if target_format_from_worker and \
-            hasattr(conversion_func, '__code__') and \
-            'target_format_from_worker' in conversion_func.__code__.co_varnames else format_out
+        effective_format_out = target_format_from_worker if pass_target_format else format_out
 
         if effective_format_out:
             expected_primary_output_filename = f"{name_part}.{effective_format_out}"
@@ -523,7 +576,8 @@ def process_file(file_path, conversion_func, format_out, format_out2=None,
             if file_progress_reporter:
                 file_progress_reporter(100)  # Complete
             cleanup(temp_path_for_this_file,
-                    file_path if config.settings.DELETE_SOURCE_ON_SUCCESS else None, output_signal, error_signal)
+                    file_path if delete_source_on_success else None, output_signal, error_signal,
+                    source_dependencies=source_dependencies)
             return True
         else:
             cleanup(temp_path_for_this_file,
@@ -545,7 +599,22 @@ def print_help(formats_in, format_out, format_out2=None):
     pass
 
 
-def _get_cue_dependencies(cue_file_path):
+def _get_sheet_dependencies(file_path, file_ext=None, error_signal=None):
+    """
+    Returns the dependent files of a .cue or .gdi sheet, or an empty list for any other input.
+    `file_ext` may be passed (lowercase, with dot) when the caller has already split the path.
+    Parse errors go to `error_signal` when given, otherwise to the console.
+    """
+    if file_ext is None:
+        file_ext = os.path.splitext(file_path)[1].lower()
+    if file_ext == '.cue':
+        return _get_cue_dependencies(file_path, error_signal)
+    if file_ext == '.gdi':
+        return _get_gdi_dependencies(file_path, error_signal)
+    return []
+
+
+def _get_cue_dependencies(cue_file_path, error_signal=None):
     """
     Parses a .cue file and returns a list of absolute paths to dependent files.
     """
@@ -573,22 +642,22 @@ def _get_cue_dependencies(cue_file_path):
                             abs_path = os.path.join(cue_dir, filename)
                             dependencies.append(os.path.normpath(abs_path))
                         else:
-                            _emit_or_print(f"Could not parse FILE line in CUE: {line}", is_error=True)
+                            _emit_or_print(f"Could not parse FILE line in CUE: {line}", error_signal, is_error=True)
 
     except FileNotFoundError:
-        _emit_or_print(f"ERROR: CUE file not found: {cue_file_path}", is_error=True)
+        _emit_or_print(f"ERROR: CUE file not found: {cue_file_path}", error_signal, is_error=True)
         return []
     except IOError as e:
-        _emit_or_print(f"ERROR: Could not read CUE file: {cue_file_path} - {e}", is_error=True)
+        _emit_or_print(f"ERROR: Could not read CUE file: {cue_file_path} - {e}", error_signal, is_error=True)
         return []
     except Exception as e:
-        _emit_or_print(f"ERROR: Unexpected error processing CUE file: {cue_file_path} - {e}", is_error=True)
+        _emit_or_print(f"ERROR: Unexpected error processing CUE file: {cue_file_path} - {e}", error_signal, is_error=True)
         return []
 
     return dependencies
 
 
-def _get_gdi_dependencies(gdi_file_path):
+def _get_gdi_dependencies(gdi_file_path, error_signal=None):
     """
     Parses a .gdi file and returns a list of absolute paths to dependent track files.
     """
@@ -618,7 +687,7 @@ def _get_gdi_dependencies(gdi_file_path):
                         filename = unquoted_filename
                     else:
                         # This case should ideally not be reached if regex matches and is well-formed.
-                        _emit_or_print(f"Could not parse filename from GDI line: {line}", signal=None, is_error=True) # Assuming no signal available here
+                        _emit_or_print(f"Could not parse filename from GDI line: {line}", error_signal, is_error=True)
                         continue
 
                     # The regex groups already handle stripping the quotes.
@@ -626,7 +695,7 @@ def _get_gdi_dependencies(gdi_file_path):
                     filename = filename.strip()
 
                     if not filename: # Skip if filename ended up empty after strip
-                        _emit_or_print(f"Empty filename parsed from GDI line: {line}", signal=None, is_error=True)
+                        _emit_or_print(f"Empty filename parsed from GDI line: {line}", error_signal, is_error=True)
                         continue
 
                     abs_path = os.path.join(gdi_dir, filename)
@@ -635,13 +704,13 @@ def _get_gdi_dependencies(gdi_file_path):
                 # (e.g., the first line with track count, comments, or malformed lines)
 
     except FileNotFoundError:
-        _emit_or_print(f"ERROR: GDI file not found: {gdi_file_path}", signal=None, is_error=True)
+        _emit_or_print(f"ERROR: GDI file not found: {gdi_file_path}", error_signal, is_error=True)
         return []
     except IOError as e:
-        _emit_or_print(f"ERROR: Could not read GDI file: {gdi_file_path} - {e}", signal=None, is_error=True)
+        _emit_or_print(f"ERROR: Could not read GDI file: {gdi_file_path} - {e}", error_signal, is_error=True)
         return []
     except Exception as e:
-        _emit_or_print(f"ERROR: Unexpected error processing GDI file: {gdi_file_path} - {e}", signal=None, is_error=True)
+        _emit_or_print(f"ERROR: Unexpected error processing GDI file: {gdi_file_path} - {e}", error_signal, is_error=True)
         return []
 
     return dependencies